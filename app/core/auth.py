@@ -2,52 +2,247 @@
 Authentication and authorization utilities
 """
 
-from datetime import datetime, timedelta, timezone
-from typing import Optional
-from jose import JWTError, jwt
+import asyncio
+import base64
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Optional
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+import jwt
+import orjson
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+from jwt.exceptions import PyJWTError as JWTError
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.core.config import get_settings
+from app.core.config import get_cached_settings
 from app.database import get_async_session
 from app.models import Users
 
-settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+settings = get_cached_settings()
+# New hashes use argon2id; bcrypt stays verifiable and is upgraded on the next login.
+# Both are called directly, passlib is only kept for any other legacy hash format.
+_argon2 = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$")
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+# Dedicated pool for hashing, one thread per core: a burst of logins queues here
+# instead of filling asyncio's default executor used by the rest of the app.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
 security = HTTPBearer()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
+def _load_jwt_keys(s) -> tuple[Any, Any]:
+    """Return the (signing, verification) keys for the configured JWT algorithm.
+
+    HMAC algorithms use the shared secret. Asymmetric algorithms read their PEM
+    files once and keep the parsed key objects, so PyJWT never re-parses a PEM.
+    """
+    if s.algorithm.upper().startswith("HS"):
+        return s.secret_key, s.secret_key
+    if not s.public_key_path:
+        raise ValueError(f"auth.public_key_path is required for algorithm {s.algorithm}")
+    with open(s.public_key_path, "rb") as fh:
+        verify_key = load_pem_public_key(fh.read())
+    signing_key = None
+    if s.private_key_path:
+        with open(s.private_key_path, "rb") as fh:
+            signing_key = load_pem_private_key(fh.read(), password=None)
+    return signing_key, verify_key
+
+# JWT parameters snapshotted once so the per-request decode does not go through the
+# settings model. Missing exp/sub claims are rejected by jwt.decode itself.
+_SIGNING_KEY, _VERIFY_KEY = _load_jwt_keys(settings)
+_ALGS = [settings.algorithm]
+_EXPIRE_SECONDS = settings.access_token_expire_minutes * 60
+_DECODE_OPTS = {"require": ["exp", "sub"], "verify_aud": False}
+
+def _cred_exc() -> HTTPException:
+    """A fresh 401; instances are never shared between requests"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+# Statements of the two auth queries, built once and executed with bound parameters
+_USER_BY_EMAIL = select(Users).where(Users.email == bindparam("email"))
+_USER_BY_ID = select(Users).where(Users.id == bindparam("user_id"))
+_PASSWORD_HASH = select(Users.password_hash).where(Users.id == bindparam("user_id"))
+
+# Successful password verifications, keyed by SHA-256 of password + stored hash, so a
+# client re-logging in within a short window does not pay the full hashing cost again.
+_verify_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+# Verified tokens -> (user id, token exp). Keyed by the SHA-256 of the bearer token so
+# raw credentials are never kept in memory. Failures are never cached.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+
+# User id -> column snapshot of the user row, without password_hash. bump_user() only
+# reaches this worker's cache, so the password is always read fresh from the database.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Token hash -> future resolving to the user snapshot (None if the token was rejected)
+# while a verification is running, so concurrent cold requests carrying the same token
+# share one decode and query.
+_inflight: dict[bytes, asyncio.Future] = {}
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+def _user_snapshot(user: Users) -> dict[str, Any]:
+    """Copy the column values of a user, except its password hash, so they can outlive its session"""
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in sa_inspect(Users).column_attrs
+        if attr.key != "password_hash"
+    }
+
+async def _attach_user(db: AsyncSession, snapshot: dict[str, Any]) -> Users:
+    """Rebuild a persistent user in the current session without querying the database"""
+    user = Users(**snapshot)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+def bump_user(user_id: Any) -> None:
+    """Forget the cached row of a user after it was updated or deleted"""
+    _user_cache.pop(str(user_id), None)
+
+def clear_token_cache() -> None:
+    """Drop all cached token and password verifications"""
+    _token_cache.clear()
+    _user_cache.clear()
+    _verify_cache.clear()
+
+def reload_settings() -> None:
+    """Pick up settings reloaded via app.core.config and drop cached verifications"""
+    global settings, _SIGNING_KEY, _VERIFY_KEY, _ALGS, _EXPIRE_SECONDS
+    settings = get_cached_settings()
+    _SIGNING_KEY, _VERIFY_KEY = _load_jwt_keys(settings)
+    _ALGS = [settings.algorithm]
+    _EXPIRE_SECONDS = settings.access_token_expire_minutes * 60
+    clear_token_cache()
+
+def _run_hashing(func, *args):
+    """Schedule a CPU-bound hashing call on the hashing pool"""
+    return asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop"""
+    cache_key = hashlib.sha256(f"{plain_password}\0{hashed_password}".encode("utf-8")).digest()
+    if cache_key in _verify_cache:
+        return True
+    if not await _run_hashing(_check_password, plain_password, hashed_password):
+        return False
+    _verify_cache[cache_key] = True
+    return True
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    """Run the hash function matching the stored hash format"""
+    if hashed_password.startswith("$argon2id$"):
+        try:
+            return _argon2.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        try:
+            return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+        except ValueError:
+            return False
     return pwd_context.verify(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    """Generate password hash"""
-    return pwd_context.hash(password)
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash should be replaced by one with the current parameters"""
+    if hashed_password.startswith("$argon2id$"):
+        return _argon2.check_needs_rehash(hashed_password)
+    return True
+
+async def get_password_hash(password: str) -> str:
+    """Generate password hash in a worker thread"""
+    return await _run_hashing(_argon2.hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
-    
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _EXPIRE_SECONDS
+    to_encode["exp"] = int(time.time()) + lifetime
+    if _SIGNING_KEY is None:
+        raise RuntimeError("auth.private_key_path is not configured; this instance cannot issue tokens")
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_ALGS[0])
     return encoded_jwt
 
 async def authenticate_user(email: str, password: str, db: AsyncSession) -> Optional[Users]:
     """Authenticate user with email and password"""
-    result = await db.execute(select(Users).where(Users.email == email))
+    result = await db.execute(_USER_BY_EMAIL, {"email": email})
     user = result.scalar_one_or_none()
     
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await verify_password(password, user.password_hash):
         return None
+    if password_needs_rehash(user.password_hash):
+        # Transparently migrate legacy bcrypt hashes to the current scheme
+        user.password_hash = await get_password_hash(password)
+        await db.commit()
+        bump_user(user.id)
+    return user
+
+async def load_password_hash(db: AsyncSession, user_id: Any) -> Optional[str]:
+    """The stored password hash of a user, read from the database and never from a cache"""
+    return await db.scalar(_PASSWORD_HASH, {"user_id": user_id})
+
+def _peek_exp(token: str) -> Any:
+    """Read the exp claim of a token without verifying it (None if unreadable)"""
+    try:
+        payload_b64 = token.split(".", 2)[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4)))
+    except (IndexError, ValueError):
+        return None
+    return claims.get("exp") if isinstance(claims, dict) else None
+
+async def _load_user(
+    token: str,
+    cache_key: bytes,
+    cached: Optional[tuple[str, Any]],
+    db: AsyncSession,
+) -> Users:
+    """Decode the token unless already verified and fetch its user"""
+    if cached is not None:
+        user_id, exp = cached
+    else:
+        try:
+            # Reject already expired tokens before paying for signature verification
+            exp = _peek_exp(token)
+            if isinstance(exp, (int, float)) and exp <= time.time():
+                raise _cred_exc()
+            payload = jwt.decode(token, _VERIFY_KEY, algorithms=_ALGS, options=_DECODE_OPTS)
+        except JWTError:
+            raise _cred_exc()
+        user_id, exp = payload["sub"], payload["exp"]
+
+    snapshot = _user_cache.get(user_id)
+    if snapshot is not None:
+        user = await _attach_user(db, snapshot)
+    else:
+        # Get user from database
+        result = await db.execute(_USER_BY_ID, {"user_id": user_id})
+        user = result.scalar_one_or_none()
+
+        if user is None:
+            raise _cred_exc()
+        _user_cache[user_id] = _user_snapshot(user)
+
+    if cached is None:
+        _token_cache[cache_key] = (user_id, exp)
     return user
 
 async def verify_jwt_token(
@@ -55,33 +250,55 @@ async def verify_jwt_token(
     db: AsyncSession = Depends(get_async_session)
 ) -> Users:
     """Verify JWT token and return user"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
+    cache_key = _token_cache_key(credentials.credentials)
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached[1] <= time.time():
+        _token_cache.pop(cache_key, None)
+        cached = None
+
+    if cached is not None:
+        snapshot = _user_cache.get(cached[0])
+        if snapshot is not None:
+            return await _attach_user(db, snapshot)
+
+    pending = _inflight.get(cache_key)
+    if pending is not None:
+        try:
+            snapshot = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            # Only swallow the cancellation of the request we were waiting on
+            if not pending.cancelled():
+                raise
+        else:
+            if snapshot is None:
+                raise _cred_exc()
+            return await _attach_user(db, snapshot)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
     try:
-        payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=[settings.algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    # Get user from database
-    result = await db.execute(select(Users).where(Users.id == user_id))
-    user = result.scalar_one_or_none()
-    
-    if user is None:
-        raise credentials_exception
-    
-    return user
+        user = await _load_user(credentials.credentials, cache_key, cached, db)
+    except HTTPException:
+        # Rejected token: waiters raise their own 401. Any other failure cancels the
+        # future below and the waiters load the user themselves.
+        future.set_result(None)
+        raise
+    else:
+        future.set_result(_user_snapshot(user))
+        return user
+    finally:
+        if not future.done():
+            future.cancel()
+        if _inflight.get(cache_key) is future:
+            del _inflight[cache_key]
 
+@lru_cache(maxsize=None)
 def require_role(required_role: str):
-    """Decorator to require specific user role"""
+    """Decorator to require specific user role (admins are always allowed)"""
+    allowed_roles = frozenset({required_role, "admin"})
+
     def role_checker(current_user: Users = Depends(verify_jwt_token)):
-        if current_user.role != required_role and current_user.role != "admin":
+        if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required role: {required_role}"
@@ -93,6 +310,6 @@ def require_role(required_role: str):
 require_admin = require_role("admin")
 require_analyst = require_role("analyst")
 
-def get_current_user(current_user: Users = Depends(verify_jwt_token)) -> Users:
-    """Get current authenticated user"""
-    return current_user
\ No newline at end of file
+# Kept as an alias rather than a passthrough dependency, so routes resolve one
+# dependency instead of two and existing dependency_overrides keep working.
+get_current_user = verify_jwt_token
\ No newline at end of file
@@ -4,10 +4,18 @@ Configuration settings for Elettra Backend with external configuration file supp
 """
 
 import os
+import copy
 import json
 import yaml
+from dataclasses import make_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Sequence
+
+try:  # LibYAML bindings are much faster when PyYAML was built with them
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader, SafeDumper
 
 from pydantic_settings import BaseSettings
 from pydantic import Field, ValidationError, model_validator, ConfigDict, AliasPath
@@ -40,6 +48,19 @@ class Settings(BaseSettings):
     # ---- database ----
     database_url: str = Field(..., validation_alias=AliasPath("database", "url"))
     database_echo: bool = Field(..., validation_alias=AliasPath("database", "echo"))
+    # Connection pool (optional, sized per deployment)
+    database_pool_size: int = Field(20, validation_alias=AliasPath("database", "pool_size"))
+    database_max_overflow: int = Field(10, validation_alias=AliasPath("database", "max_overflow"))
+    database_pool_timeout: int = Field(30, validation_alias=AliasPath("database", "pool_timeout"))
+    database_pool_recycle: int = Field(1800, validation_alias=AliasPath("database", "pool_recycle"))
+    database_pool_pre_ping: bool = Field(True, validation_alias=AliasPath("database", "pool_pre_ping"))
+    database_query_cache_size: int = Field(5000, validation_alias=AliasPath("database", "query_cache_size"))
+    # asyncpg connection tuning (optional)
+    database_statement_cache_size: int = Field(1024, validation_alias=AliasPath("database", "statement_cache_size"))
+    database_prepared_statement_cache_size: int = Field(512, validation_alias=AliasPath("database", "prepared_statement_cache_size"))
+    database_application_name: str = Field("elettra-backend", validation_alias=AliasPath("database", "application_name"))
+    # Set when database.url points at PgBouncer in transaction pooling mode
+    database_pgbouncer: bool = Field(False, validation_alias=AliasPath("database", "pgbouncer"))
 
     # ---- server ----
     host: str = Field(..., validation_alias=AliasPath("server", "host"))
@@ -52,6 +73,9 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(
         ..., validation_alias=AliasPath("auth", "access_token_expire_minutes")
     )
+    # PEM files, only used with asymmetric algorithms (RS*/PS*/ES*)
+    private_key_path: Optional[str] = Field(None, validation_alias=AliasPath("auth", "private_key_path"))
+    public_key_path: Optional[str] = Field(None, validation_alias=AliasPath("auth", "public_key_path"))
 
     # ---- CORS ----
     allowed_origins: List[str] = Field(
@@ -121,22 +145,46 @@ class Settings(BaseSettings):
         return self.database_url
 
 
+# Immutable, slotted snapshot of a validated Settings object. Attribute reads are plain
+# slot lookups, which matters for the modules reading settings on every request.
+FrozenSettings = make_dataclass(
+    "FrozenSettings",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+    namespace={"get_database_url": lambda self: self.database_url},
+)
+
+
+def _freeze(settings: Settings) -> "FrozenSettings":
+    return FrozenSettings(**{name: getattr(settings, name) for name in Settings.model_fields})
+
+
 # --------------------------------------------------------------------------- #
 # Loader helpers
 # --------------------------------------------------------------------------- #
 
 def load_config_from_file(config_path: str) -> Dict[str, Any]:
     """Load configuration from external file (JSON or YAML)"""
-    if not os.path.exists(config_path):
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
         logger.warning(f"Configuration file not found: {config_path}")
         return {}
 
+    # Parsed files are cached per modification time; callers get their own copy
+    # because environment overrides are applied in place.
+    return copy.deepcopy(_parse_config_file(config_path, mtime))
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(config_path: str, mtime: float) -> Dict[str, Any]:
     try:
         with open(config_path, "r", encoding="utf-8") as file:
             file_extension = Path(config_path).suffix.lower()
 
             if file_extension in [".yml", ".yaml"]:
-                config_data = yaml.safe_load(file) or {}
+                config_data = yaml.load(file, Loader=SafeLoader) or {}
                 logger.info("Loaded YAML configuration from: %s", config_path)
             elif file_extension == ".json":
                 config_data = json.load(file) or {}
@@ -150,7 +198,7 @@ def load_config_from_file(config_path: str) -> Dict[str, Any]:
         return {}
 
 
-def _set_in_nested(d: Dict[str, Any], path: List[str], value: Any) -> None:
+def _set_in_nested(d: Dict[str, Any], path: Sequence[str], value: Any) -> None:
     """Set a nested key path in a dict, creating intermediate dicts."""
     cur = d
     for key in path[:-1]:
@@ -160,27 +208,67 @@ def _set_in_nested(d: Dict[str, Any], path: List[str], value: Any) -> None:
     cur[path[-1]] = value
 
 
+_CANDIDATE_PATHS = (
+    "config/elettra-config.yaml",
+    "config/elettra-config.yml",
+    "config/elettra-config.json",
+    "config/elettra-config.docker.yaml",  # docker image default
+    "./elettra-config.yaml",
+    "./elettra-config.yml",
+    "./elettra-config.json",
+    "./elettra-config.docker.yaml",
+)
+
+
+def _locate_config_file() -> Optional[str]:
+    """Return the first existing candidate path, listing each directory only once."""
+    listings: Dict[str, set] = {}
+    for candidate in _CANDIDATE_PATHS:
+        directory, name = os.path.split(candidate)
+        if directory not in listings:
+            try:
+                with os.scandir(directory) as entries:
+                    listings[directory] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                listings[directory] = set()
+        if name in listings[directory]:
+            return candidate
+    return None
+
+
+def _as_bool(s: str) -> bool:
+    return s.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _as_csv_list(s: str) -> List[str]:
+    return [o.strip() for o in s.split(",") if o.strip()]
+
+
+# Environment variable overrides to nested config paths
+# (kept minimal for container flexibility)
+_OVERRIDE_ENV_MAP: Dict[str, tuple[tuple[str, ...], Callable[[str], Any]]] = {
+    "DATABASE_URL": (("database", "url"), str),
+    "APP_LOG_LEVEL": (("logging", "level"), str),
+    "APP_DEBUG": (("app", "debug"), _as_bool),
+    "APP_ALLOWED_ORIGINS": (("cors", "origins"), _as_csv_list),
+    "APP_SECRET_KEY": (("auth", "secret_key"), str),
+}
+
+
+def _resolve_config_path() -> Optional[str]:
+    return os.getenv("ELETTRA_CONFIG_FILE") or _locate_config_file()
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Locate the configuration file, load it and return a validated Settings
     object. Missing keys raise a ValidationError and stop application startup.
+    The result is cached; use reload_settings() to pick up changes.
     """
-    cfg_path = os.getenv("ELETTRA_CONFIG_FILE")
-    if not cfg_path:
-        for candidate in (
-            "config/elettra-config.yaml",
-            "config/elettra-config.yml",
-            "config/elettra-config.json",
-            "config/elettra-config.docker.yaml",  # docker image default
-            "./elettra-config.yaml",
-            "./elettra-config.yml",
-            "./elettra-config.json",
-            "./elettra-config.docker.yaml",
-        ):
-            if Path(candidate).exists():
-                cfg_path = candidate
-                logger.info("Using configuration file: %s", cfg_path)
-                break
+    cfg_path = _resolve_config_path()
+    if cfg_path:
+        logger.info("Using configuration file: %s", cfg_path)
 
     if not cfg_path:
         raise FileNotFoundError(
@@ -191,22 +279,7 @@ def get_settings() -> Settings:
     cfg_dict = load_config_from_file(cfg_path)
 
     # Explicit environment variable overrides to nested paths
-    # (kept minimal for container flexibility)
-    def _as_bool(s: str) -> bool:
-        return s.strip().lower() in ("1", "true", "yes", "on")
-
-    def _as_csv_list(s: str) -> List[str]:
-        return [o.strip() for o in s.split(",") if o.strip()]
-
-    override_env_map: Dict[str, tuple[List[str], Callable[[str], Any]]] = {
-        "DATABASE_URL": (["database", "url"], str),
-        "APP_LOG_LEVEL": (["logging", "level"], str),
-        "APP_DEBUG": (["app", "debug"], _as_bool),
-        "APP_ALLOWED_ORIGINS": (["cors", "origins"], _as_csv_list),
-        "APP_SECRET_KEY": (["auth", "secret_key"], str),
-    }
-
-    for env_key, (path_keys, caster) in override_env_map.items():
+    for env_key, (path_keys, caster) in _OVERRIDE_ENV_MAP.items():
         raw = os.environ.get(env_key)
         if raw is not None and raw.strip():
             try:
@@ -223,19 +296,28 @@ def get_settings() -> Settings:
         raise
 
 
-# Global settings instance (simple cache)
-_settings: Optional[Settings] = None
+# Parse the config file at import so that a preloading server (e.g. gunicorn --preload)
+# hands the parsed document to its forked workers instead of each one re-reading it.
+# The parse cache is keyed on mtime, so an edited file is still picked up on reload.
+if os.environ.get("ELETTRA_PRELOAD", "1") == "1":
+    _preload_path = _resolve_config_path()
+    if _preload_path and os.path.isfile(_preload_path):
+        _parse_config_file(_preload_path, os.path.getmtime(_preload_path))
+
+# Global settings instance (simple cache), frozen after validation
+_settings: Optional["FrozenSettings"] = None
 
-def get_cached_settings() -> Settings:
+def get_cached_settings() -> "FrozenSettings":
     global _settings
     if _settings is None:
-        _settings = get_settings()
+        _settings = _freeze(get_settings())
     return _settings
 
 def reload_settings():
     global _settings
     _settings = None
-    _settings = get_settings()
+    get_settings.cache_clear()
+    _settings = _freeze(get_settings())
     logger.info("Settings reloaded")
 
 
@@ -247,7 +329,7 @@ def _write_yaml(path: Path, data: Dict[str, Any]) -> None:  # pragma: no cover
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("w", encoding="utf-8") as fh:
-            yaml.safe_dump(data, fh, sort_keys=False)
+            yaml.dump(data, fh, Dumper=SafeDumper, sort_keys=False)
         logger.info("📄 Added missing keys – configuration file updated at %s", path)
     except Exception as exc:
         logger.error("Unable to write updated configuration file %s: %s", path, exc)
@@ -2,28 +2,27 @@
 Database configuration and models for existing Elettra database
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
-from sqlalchemy import Column, String, DateTime, UUID, Text, Integer, Boolean, Numeric, ForeignKey, JSON, select
-from sqlalchemy.dialects.postgresql import JSONB, ENUM as PG_ENUM
+import asyncio
+import itertools
+from functools import lru_cache
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import configure_mappers, declarative_base, relationship, sessionmaker
+from sqlalchemy import Column, String, DateTime, UUID, Text, Integer, Boolean, Float, ForeignKey, JSON, select, event, inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine.default import CACHE_MISS
 from sqlalchemy.sql import func
+import orjson
 import uuid
-from enum import Enum as PyEnum
 from app.core.config import get_cached_settings
-from datetime import datetime
+from app.enums import SIM_STATUS, USER_ROLE
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Optional, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Base class for all models
 Base = declarative_base()
 
-# Database enums
-sim_status_enum = PG_ENUM('pending', 'running', 'completed', 'failed', name='sim_status', create_type=False)
-
-class GTFSDatasetStatus(PyEnum):
-    PENDING = "pending"
-    DOWNLOADING = "downloading" 
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed"
 
 class Company(Base):
     """Company model"""
@@ -31,7 +30,7 @@ class Company(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False, unique=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
     users = relationship("User", back_populates="company")
@@ -50,8 +49,8 @@ class User(Base):
     email = Column(String, nullable=False, unique=True)
     full_name = Column(String, nullable=False)
     password_hash = Column(String, nullable=False)
-    role = Column(String, nullable=False)  # 'admin', 'analyst', 'viewer'
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    role = Column(USER_ROLE, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
     company = relationship("Company", back_populates="users")
@@ -98,11 +97,11 @@ class SimulationRun(Base):
     route_segment_end_stop = Column(UUID(as_uuid=True), ForeignKey("route_stops.id"), nullable=True)
     
     input_params = Column(JSON, nullable=False)
-    optimal_battery_kwh = Column(Numeric)
+    optimal_battery_kwh = Column(Float(53))
     output_results = Column(JSON)
     
-    status = Column(sim_status_enum, nullable=False, default='pending')
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    status = Column(SIM_STATUS, nullable=False, default='pending')
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     completed_at = Column(DateTime)
     
     # Relationships
@@ -123,9 +122,9 @@ class GTFSDataset(Base):
     gtfs_url = Column(String)
     osm_extract_url = Column(String)
     last_updated = Column(DateTime)
-    status = Column(String, nullable=False, default=GTFSDatasetStatus.PENDING)
+    status = Column(String, nullable=False, default="pending")
     file_path = Column(String)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
     company = relationship("Company", back_populates="gtfs_datasets")
@@ -143,7 +142,7 @@ class TransitRoute(Base):
     route_type = Column(Integer, nullable=False)
     route_color = Column(String)
     agency_name = Column(String)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
     company = relationship("Company", back_populates="transit_routes")
@@ -159,10 +158,10 @@ class RouteShape(Base):
     transit_route_id = Column(UUID(as_uuid=True), ForeignKey("transit_routes.id"), nullable=False)
     gtfs_shape_id = Column(String, nullable=False)
     shape_geom = Column(String)  # Will store as WKT string for now
-    total_distance_m = Column(Numeric)
-    elevation_gain_m = Column(Numeric)
-    avg_grade_percent = Column(Numeric)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    total_distance_m = Column(Float(53))
+    elevation_gain_m = Column(Float(53))
+    avg_grade_percent = Column(Float(53))
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
     transit_route = relationship("TransitRoute", back_populates="route_shapes")
@@ -174,32 +173,90 @@ class RouteStop(Base):
     transit_route_id = Column(UUID(as_uuid=True), ForeignKey("transit_routes.id"), nullable=False)
     gtfs_stop_id = Column(String, nullable=False)
     stop_name = Column(String, nullable=False)
-    stop_lat = Column(Numeric, nullable=False)
-    stop_lon = Column(Numeric, nullable=False)
+    stop_lat = Column(Float(53), nullable=False)
+    stop_lon = Column(Float(53), nullable=False)
     stop_sequence = Column(Integer, nullable=False)
-    distance_from_start_m = Column(Numeric)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    distance_from_start_m = Column(Float(53))
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     
     # Relationships
     transit_route = relationship("TransitRoute", back_populates="route_stops")
 
+# Resolve the relationship() strings and build the mappers of both model sets at
+# import, so a preloading server does it once before forking instead of each
+# worker paying for it on its first query
+configure_mappers()
+
 # Initialize database connection
 def get_database_url() -> str:
     """Get database URL from settings"""
     settings = get_cached_settings()
     return settings.get_database_url()
 
-def get_sync_database_url():
-    """Get synchronous database URL for migrations"""
+def get_sync_database_url() -> str:
+    """Database URL for synchronous tools (migrations): the engine's URL with the default driver"""
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+def _json_dumps(value: Any) -> str:
+    """JSON/JSONB bind serializer; like json.dumps, non-string dict keys are stringified"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def _prepared_statement_name() -> str:
+    # Unique per statement, so names never clash between the server connections
+    # PgBouncer hands out across transactions
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+def get_engine_options() -> dict:
+    """Engine keyword arguments (echo, pool sizing, JSON codec, asyncpg options) from settings"""
     settings = get_cached_settings()
-    return f"postgresql://{settings.database_url}"
+    server_settings = {"application_name": settings.database_application_name}
+    connect_args = {
+        # asyncpg's own per-connection prepared statement LRU
+        "statement_cache_size": settings.database_statement_cache_size,
+        # SQLAlchemy's asyncpg adapter cache of prepared statements
+        "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+        "server_settings": server_settings,
+    }
+    if settings.database_pgbouncer:
+        # PgBouncer (>= 1.21, max_prepared_statements > 0) tracks protocol-level
+        # prepared statements itself, but rejects unknown startup parameters, so
+        # jit must be turned off on the role instead
+        connect_args["prepared_statement_name_func"] = _prepared_statement_name
+    else:
+        # The API only issues short OLTP queries; JIT compilation would cost more than it saves
+        server_settings["jit"] = "off"
+    return {
+        "echo": settings.database_echo,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        # Compiled statement cache; the default of 500 is small for the GTFS query shapes
+        "query_cache_size": settings.database_query_cache_size,
+        "json_serializer": _json_dumps,
+        "json_deserializer": orjson.loads,
+        "connect_args": connect_args,
+    }
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """The process-wide async engine; every session factory must be built on it"""
+    return create_async_engine(
+        get_database_url(),
+        future=True,
+        **get_engine_options()
+    )
 
 # Create async engine
-engine = create_async_engine(
-    get_database_url(),
-    echo=get_cached_settings().database_echo,
-    future=True
-)
+engine = get_engine()
+
+if get_cached_settings().debug:
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _log_statement_cache_miss(conn, cursor, statement, parameters, context, executemany):
+        """Report statements that had to be compiled again (development aid)"""
+        if context is not None and context.cache_hit is CACHE_MISS:
+            logger.debug("Statement cache miss: %s", statement.split("\n", 1)[0][:200])
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -207,10 +264,116 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+async def copy_records(
+    session: AsyncSession,
+    model: Any,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+    ignore_conflicts: bool = False,
+) -> None:
+    """Stream tuples into the model's table with binary COPY inside the session's transaction.
+
+    Values must already be asyncpg-native (uuid.UUID, datetime, ...). Columns left out
+    of `columns` get their server defaults, e.g. generated UUID primary keys.
+    COPY aborts on the first duplicate key, so with ignore_conflicts the records go
+    to a temporary staging table and are moved over with ON CONFLICT DO NOTHING.
+    """
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    table = model.__table__
+    schema = table.schema or "public"
+    if not ignore_conflicts:
+        await driver.copy_records_to_table(
+            table.name, records=records, columns=list(columns), schema_name=schema
+        )
+        return
+
+    staging = f"_copy_{table.name}"
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    await driver.execute(
+        f'CREATE TEMP TABLE "{staging}" ON COMMIT DROP AS '
+        f'SELECT {column_list} FROM "{schema}"."{table.name}" WITH NO DATA'
+    )
+    await driver.copy_records_to_table(staging, records=records, columns=list(columns))
+    await driver.execute(
+        f'INSERT INTO "{schema}"."{table.name}" ({column_list}) '
+        f'SELECT {column_list} FROM "{staging}" ON CONFLICT DO NOTHING'
+    )
+    await driver.execute(f'DROP TABLE "{staging}"')
+
+async def copy_rows(
+    session: AsyncSession,
+    model: Any,
+    rows: Iterable[Mapping[str, Any]],
+    columns: Optional[Sequence[str]] = None,
+    ignore_conflicts: bool = False,
+) -> None:
+    """Bulk load dict rows through COPY, by default in the columns of the first row's keys.
+
+    Meant for large loads such as weather series.
+    Values pass through the columns' bind processors, as they would for an INSERT,
+    so custom types such as GtfsTime accept their Python-side form.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+    columns = tuple(columns or first)
+    table = model.__table__
+    processors = [
+        (index, processor)
+        for index, column in enumerate(columns)
+        if (processor := table.c[column].type.bind_processor(engine.dialect)) is not None
+    ]
+
+    def records():
+        for row in itertools.chain((first,), rows):
+            record = [row.get(column) for column in columns]
+            for index, processor in processors:
+                record[index] = processor(record[index])
+            yield record
+
+    await copy_records(session, model, columns, records(), ignore_conflicts=ignore_conflicts)
+
+async def gather_with_sessions(
+    db: AsyncSession,
+    *calls: Callable[[AsyncSession], Awaitable[Any]],
+    max_concurrency: Optional[int] = None,
+) -> list[Any]:
+    """Run independent read-only lookups concurrently, each on its own pooled session.
+
+    A session executes one statement at a time, so overlapping round trips needs
+    one session (and connection) per call. The sessions are bound to the same
+    engine as the request's session `db`, so an overridden get_async_session is
+    honoured. The request already holds a connection, so at most a quarter of the
+    pool (or `max_concurrency`) is taken on top of it at once. Results come back in
+    call order; returned ORM objects are detached.
+    """
+    if max_concurrency is None:
+        max_concurrency = max(1, get_cached_settings().database_pool_size // 4)
+    limit = asyncio.Semaphore(max_concurrency)
+    bind = db.bind
+    if isinstance(bind, AsyncConnection):
+        # A connection cannot run statements concurrently; open new ones on its engine
+        bind = bind.engine
+
+    async def run(call: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with limit, AsyncSession(bind, expire_on_commit=False) as session:
+            return await call(session)
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+def columns_for(model: Any, schema: type) -> tuple:
+    """The mapped columns of `model` that the pydantic `schema` renders, in field order.
+
+    Lets list endpoints select plain rows for a response model instead of
+    hydrating ORM instances that are serialized and dropped straight away.
+    """
+    mapped = sa_inspect(model).column_attrs
+    return tuple(getattr(model, name) for name in schema.model_fields if name in mapped)
+
 async def get_async_session() -> AsyncSession:
     """Dependency to get async database session"""
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
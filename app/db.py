@@ -1,16 +1,13 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+"""
+Compatibility aliases for the single engine and session factory in app.database
+"""
+
 from app.core.config import get_cached_settings
+from app.database import AsyncSessionLocal as SessionLocal, engine, get_async_session as get_session
+
+__all__ = ["engine", "SessionLocal", "get_session", "get_database_config"]
 
 def get_database_config():
     """Get database configuration from settings"""
     settings = get_cached_settings()
     return settings.database_url, settings.database_echo
-
-DATABASE_URL, DATABASE_ECHO = get_database_config()
-
-engine = create_async_engine(DATABASE_URL, echo=DATABASE_ECHO, future=True)
-SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
-
-async def get_session() -> AsyncSession:
-    async with SessionLocal() as session:
-        yield session
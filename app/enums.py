@@ -0,0 +1,18 @@
+"""
+PostgreSQL enum types shared by the model modules
+"""
+
+from typing import Literal
+
+from sqlalchemy.dialects.postgresql import ENUM
+
+# The types are created by db/elettra_schema.sql; each is defined here exactly once
+# so every column reuses the same type object instead of declaring its own copy.
+SimStatus = Literal['pending', 'running', 'completed', 'failed']
+SIM_STATUS = ENUM('pending', 'running', 'completed', 'failed', name='sim_status', create_type=False)
+
+TripStatusValue = Literal['gtfs', 'depot', 'school', 'service', 'other', 'transfer']
+TRIP_STATUS = ENUM('gtfs', 'depot', 'school', 'service', 'other', 'transfer', name='trip_status', create_type=False)
+
+UserRole = Literal['admin', 'analyst', 'viewer']
+USER_ROLE = ENUM('admin', 'analyst', 'viewer', name='user_role', create_type=False)
@@ -1,12 +1,14 @@
 from typing import Optional
 import datetime
-import decimal
 import uuid
 
-from sqlalchemy import CheckConstraint, Date, DateTime, Double, Enum, ForeignKeyConstraint, Index, Integer, Numeric, PrimaryKeyConstraint, REAL, String, Text, UniqueConstraint, Uuid, text
+from sqlalchemy import BigInteger, CheckConstraint, Date, DateTime, Double, ForeignKeyConstraint, Identity, Index, Integer, PrimaryKeyConstraint, REAL, SmallInteger, String, Text, UniqueConstraint, Uuid, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from app.enums import SIM_STATUS, TRIP_STATUS, USER_ROLE
+from app.types import GtfsTime
+
 class Base(DeclarativeBase):
     pass
 
@@ -15,10 +17,11 @@ class GtfsAgencies(Base):
     __tablename__ = 'gtfs_agencies'
     __table_args__ = (
         PrimaryKeyConstraint('id', name='gtfs_agency_pkey'),
-        UniqueConstraint('gtfs_agency_id', name='gtfs_agency_gtfs_agency_id_key')
+        UniqueConstraint('gtfs_agency_id', name='gtfs_agency_gtfs_agency_id_key'),
+        Index('gtfs_agency_agency_name_idx', 'agency_name', 'id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     gtfs_agency_id: Mapped[str] = mapped_column(Text, nullable=False)
     agency_name: Mapped[str] = mapped_column(Text, nullable=False)
     agency_url: Mapped[str] = mapped_column(Text, nullable=False)
@@ -28,17 +31,18 @@ class GtfsAgencies(Base):
     agency_fare_url: Mapped[Optional[str]] = mapped_column(Text)
     agency_email: Mapped[Optional[str]] = mapped_column(Text)
 
-    gtfs_routes: Mapped[list['GtfsRoutes']] = relationship('GtfsRoutes', back_populates='agency')
-    users: Mapped[list['Users']] = relationship('Users', back_populates='company')
+    gtfs_routes: Mapped[list['GtfsRoutes']] = relationship('GtfsRoutes', back_populates='agency', viewonly=True, lazy='raise_on_sql')
+    users: Mapped[list['Users']] = relationship('Users', back_populates='company', viewonly=True, lazy='raise_on_sql')
 
 
 class GtfsCalendar(Base):
     __tablename__ = 'gtfs_calendar'
     __table_args__ = (
         PrimaryKeyConstraint('id', name='gtfs_calendar_pkey'),
+        Index('gtfs_calendar_service_id_idx', 'service_id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     service_id: Mapped[str] = mapped_column(Text, nullable=False)
     monday: Mapped[int] = mapped_column(Integer, nullable=False)
     tuesday: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -61,7 +65,7 @@ class GtfsStops(Base):
         PrimaryKeyConstraint('id', name='gtfs_stops_pkey')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     stop_id: Mapped[str] = mapped_column(Text, nullable=False)
     stop_code: Mapped[Optional[str]] = mapped_column(Text)
     stop_name: Mapped[Optional[str]] = mapped_column(Text)
@@ -70,22 +74,22 @@ class GtfsStops(Base):
     stop_lon: Mapped[Optional[float]] = mapped_column(Double(53))
     zone_id: Mapped[Optional[str]] = mapped_column(Text)
     stop_url: Mapped[Optional[str]] = mapped_column(Text)
-    location_type: Mapped[Optional[int]] = mapped_column(Integer)
+    location_type: Mapped[Optional[int]] = mapped_column(SmallInteger)
     parent_station: Mapped[Optional[str]] = mapped_column(Text)
     stop_timezone: Mapped[Optional[str]] = mapped_column(Text)
-    wheelchair_boarding: Mapped[Optional[int]] = mapped_column(Integer)
+    wheelchair_boarding: Mapped[Optional[int]] = mapped_column(SmallInteger)
     platform_code: Mapped[Optional[str]] = mapped_column(Text)
     level_id: Mapped[Optional[str]] = mapped_column(Text)
 
-    depots: Mapped[list['Depots']] = relationship('Depots', back_populates='stop')
+    depots: Mapped[list['Depots']] = relationship('Depots', back_populates='stop', passive_deletes=True)
     gtfs_stops_times: Mapped[list['GtfsStopsTimes']] = relationship('GtfsStopsTimes', back_populates='stop')
 
 
 class WeatherMeasurements(Base):
     __tablename__ = 'weather_measurements'
     __table_args__ = (
-        CheckConstraint("latitude >= '-90'::integer::numeric AND latitude <= 90::numeric", name='ck_lat_range'),
-        CheckConstraint("longitude >= '-180'::integer::numeric AND longitude <= 180::numeric", name='ck_lon_range'),
+        CheckConstraint("latitude >= '-90'::integer::double precision AND latitude <= 90::double precision", name='ck_lat_range'),
+        CheckConstraint("longitude >= '-180'::integer::double precision AND longitude <= 180::double precision", name='ck_lon_range'),
         CheckConstraint('pressure > 0', name='weather_measurements_pressure_check'),
         CheckConstraint('relative_humidity >= 0::double precision AND relative_humidity <= 100::double precision', name='weather_measurements_relative_humidity_check'),
         CheckConstraint('wind_direction >= 0::double precision AND wind_direction < 360::double precision', name='weather_measurements_wind_direction_check'),
@@ -93,13 +97,13 @@ class WeatherMeasurements(Base):
         PrimaryKeyConstraint('id', name='weather_measurements_pkey'),
         UniqueConstraint('time_utc', 'latitude', 'longitude', name='uq_weather_time_lat_lon'),
         Index('ix_weather_lat_lon', 'latitude', 'longitude'),
-        Index('ix_weather_time_brin', 'time_utc')
+        Index('ix_weather_time_brin', 'time_utc', postgresql_using='brin')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=True, start=1, increment=1, minvalue=1, maxvalue=9223372036854775807, cycle=False, cache=1), primary_key=True)
     time_utc: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False)
-    latitude: Mapped[decimal.Decimal] = mapped_column(Numeric(8, 5), nullable=False)
-    longitude: Mapped[decimal.Decimal] = mapped_column(Numeric(9, 5), nullable=False)
+    latitude: Mapped[float] = mapped_column(Double(53), nullable=False)
+    longitude: Mapped[float] = mapped_column(Double(53), nullable=False)
     temp_air: Mapped[Optional[float]] = mapped_column(REAL)
     relative_humidity: Mapped[Optional[float]] = mapped_column(REAL)
     ghi: Mapped[Optional[float]] = mapped_column(REAL)
@@ -115,10 +119,11 @@ class GtfsRoutes(Base):
     __tablename__ = 'gtfs_routes'
     __table_args__ = (
         ForeignKeyConstraint(['agency_id'], ['gtfs_agencies.id'], name='gtfs_routes_agency_id_fkey'),
-        PrimaryKeyConstraint('id', name='gtfs_routes_pkey')
+        PrimaryKeyConstraint('id', name='gtfs_routes_pkey'),
+        Index('gtfs_routes_agency_feed_idx', 'agency_id', 'gtfs_year', 'gtfs_file_date')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     route_id: Mapped[str] = mapped_column(Text, nullable=False)
     agency_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     gtfs_file_date: Mapped[datetime.date] = mapped_column(Date, nullable=False, server_default=text("'2025-04-14'::date"))
@@ -131,36 +136,36 @@ class GtfsRoutes(Base):
     route_color: Mapped[Optional[str]] = mapped_column(Text)
     route_text_color: Mapped[Optional[str]] = mapped_column(Text)
     route_sort_order: Mapped[Optional[int]] = mapped_column(Integer)
-    continuous_pickup: Mapped[Optional[int]] = mapped_column(Integer)
-    continuous_drop_off: Mapped[Optional[int]] = mapped_column(Integer)
+    continuous_pickup: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    continuous_drop_off: Mapped[Optional[int]] = mapped_column(SmallInteger)
 
     agency: Mapped['GtfsAgencies'] = relationship('GtfsAgencies', back_populates='gtfs_routes')
-    gtfs_trips: Mapped[list['GtfsTrips']] = relationship('GtfsTrips', back_populates='route')
-    variants: Mapped[list['Variants']] = relationship('Variants', back_populates='route')
+    gtfs_trips: Mapped[list['GtfsTrips']] = relationship('GtfsTrips', back_populates='route', viewonly=True, lazy='raise_on_sql')
+    variants: Mapped[list['Variants']] = relationship('Variants', back_populates='route', viewonly=True, lazy='raise_on_sql')
 
 
 class Users(Base):
     __tablename__ = 'users'
     __table_args__ = (
-        CheckConstraint("role = ANY (ARRAY['admin'::text, 'analyst'::text, 'viewer'::text])", name='users_role_check'),
         ForeignKeyConstraint(['company_id'], ['gtfs_agencies.id'], ondelete='CASCADE', name='users_gtfs_agencies_id_fkey'),
         PrimaryKeyConstraint('id', name='users_pkey'),
-        UniqueConstraint('email', name='users_email_key')
+        UniqueConstraint('email', name='users_email_key'),
+        Index('users_created_at_idx', 'created_at', 'id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     company_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     email: Mapped[str] = mapped_column(Text, nullable=False)
     full_name: Mapped[str] = mapped_column(Text, nullable=False)
     password_hash: Mapped[str] = mapped_column(Text, nullable=False)
-    role: Mapped[str] = mapped_column(Text, nullable=False)
+    role: Mapped[str] = mapped_column(USER_ROLE, nullable=False)
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, server_default=text('now()'))
 
     company: Mapped['GtfsAgencies'] = relationship('GtfsAgencies', back_populates='users')
-    buses_models: Mapped[list['BusesModels']] = relationship('BusesModels', back_populates='user')
-    depots: Mapped[list['Depots']] = relationship('Depots', back_populates='user')
-    buses: Mapped[list['Buses']] = relationship('Buses', back_populates='user')
-    simulation_runs: Mapped[list['SimulationRuns']] = relationship('SimulationRuns', back_populates='user')
+    buses_models: Mapped[list['BusesModels']] = relationship('BusesModels', back_populates='user', passive_deletes=True)
+    depots: Mapped[list['Depots']] = relationship('Depots', back_populates='user', passive_deletes=True)
+    buses: Mapped[list['Buses']] = relationship('Buses', back_populates='user', passive_deletes=True)
+    simulation_runs: Mapped[list['SimulationRuns']] = relationship('SimulationRuns', back_populates='user', passive_deletes=True)
 
 
 class BusesModels(Base):
@@ -171,7 +176,7 @@ class BusesModels(Base):
         UniqueConstraint('name', 'user_id', name='user_buses_models_name_unique')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(Text, nullable=False)
     specs: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
@@ -191,7 +196,7 @@ class Depots(Base):
         Index('depots_agency_id_idx', 'user_id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     name: Mapped[str] = mapped_column(Text, nullable=False)
     address: Mapped[Optional[str]] = mapped_column(Text)
@@ -208,31 +213,32 @@ class GtfsTrips(Base):
         ForeignKeyConstraint(['route_id'], ['gtfs_routes.id'], name='gtfs_trips_route_id_fkey'),
         ForeignKeyConstraint(['service_id'], ['gtfs_calendar.id'], name='gtfs_trips_service_fk'),
         PrimaryKeyConstraint('id', name='gtfs_trips_pkey'),
+        Index('gtfs_trips_route_service_idx', 'route_id', 'service_id'),
         Index('gtfs_trips_trip_id_udx', 'trip_id', unique=True)
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     route_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     service_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     gtfs_service_id: Mapped[str] = mapped_column(Text, nullable=False)
     trip_id: Mapped[str] = mapped_column(Text, nullable=False)
-    status: Mapped[str] = mapped_column(Enum('gtfs', 'depot', 'school', 'service', 'other', 'transfer', name='trip_status'), nullable=False, server_default=text("'gtfs'::trip_status"))
+    status: Mapped[str] = mapped_column(TRIP_STATUS, nullable=False, server_default=text("'gtfs'::trip_status"))
     trip_headsign: Mapped[Optional[str]] = mapped_column(Text)
     trip_short_name: Mapped[Optional[str]] = mapped_column(Text)
-    direction_id: Mapped[Optional[int]] = mapped_column(Integer)
+    direction_id: Mapped[Optional[int]] = mapped_column(SmallInteger)
     block_id: Mapped[Optional[str]] = mapped_column(Text)
     shape_id: Mapped[Optional[str]] = mapped_column(Text)
-    wheelchair_accessible: Mapped[Optional[int]] = mapped_column(Integer)
-    bikes_allowed: Mapped[Optional[int]] = mapped_column(Integer)
+    wheelchair_accessible: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    bikes_allowed: Mapped[Optional[int]] = mapped_column(SmallInteger)
     start_stop_name: Mapped[Optional[str]] = mapped_column(String)
     end_stop_name: Mapped[Optional[str]] = mapped_column(String)
-    departure_time: Mapped[Optional[str]] = mapped_column(String)
-    arrival_time: Mapped[Optional[str]] = mapped_column(String)
+    departure_time: Mapped[Optional[str]] = mapped_column(GtfsTime)
+    arrival_time: Mapped[Optional[str]] = mapped_column(GtfsTime)
 
     route: Mapped['GtfsRoutes'] = relationship('GtfsRoutes', back_populates='gtfs_trips')
     service: Mapped['GtfsCalendar'] = relationship('GtfsCalendar', back_populates='gtfs_trips')
-    gtfs_stops_times: Mapped[list['GtfsStopsTimes']] = relationship('GtfsStopsTimes', back_populates='trip')
-    shifts_structures: Mapped[list['ShiftsStructures']] = relationship('ShiftsStructures', back_populates='trip')
+    gtfs_stops_times: Mapped[list['GtfsStopsTimes']] = relationship('GtfsStopsTimes', back_populates='trip', passive_deletes=True)
+    shifts_structures: Mapped[list['ShiftsStructures']] = relationship('ShiftsStructures', back_populates='trip', passive_deletes=True)
 
 
 class Variants(Base):
@@ -245,14 +251,14 @@ class Variants(Base):
         Index('variants_route_id_idx', 'route_id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     route_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     variant_num: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, server_default=text('now()'))
     shape_id: Mapped[str] = mapped_column(String, nullable=False)
 
     route: Mapped['GtfsRoutes'] = relationship('GtfsRoutes', back_populates='variants')
-    simulation_runs: Mapped[list['SimulationRuns']] = relationship('SimulationRuns', back_populates='variant')
+    simulation_runs: Mapped[list['SimulationRuns']] = relationship('SimulationRuns', back_populates='variant', passive_deletes=True)
 
 
 class Buses(Base):
@@ -265,7 +271,7 @@ class Buses(Base):
         Index('idx_buses_bus_model_id', 'bus_model_id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     name: Mapped[str] = mapped_column(Text, nullable=False)
     specs: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
@@ -273,31 +279,30 @@ class Buses(Base):
 
     bus_model: Mapped[Optional['BusesModels']] = relationship('BusesModels', back_populates='buses')
     user: Mapped['Users'] = relationship('Users', back_populates='buses')
-    shifts: Mapped[list['Shifts']] = relationship('Shifts', back_populates='bus')
+    shifts: Mapped[list['Shifts']] = relationship('Shifts', back_populates='bus', passive_deletes=True)
 
 
 class GtfsStopsTimes(Base):
     __tablename__ = 'gtfs_stops_times'
     __table_args__ = (
         ForeignKeyConstraint(['stop_id'], ['gtfs_stops.id'], name='gtfs_stops_times_stop_id_fkey'),
-        ForeignKeyConstraint(['trip_id'], ['gtfs_trips.id'], name='gtfs_stops_times_trip_id_fkey'),
-        PrimaryKeyConstraint('id', name='gtfs_stops_times_pkey'),
-        Index('gtfs_stops_times_trip_seq_udx', 'trip_id', 'stop_sequence', unique=True)
+        ForeignKeyConstraint(['trip_id'], ['gtfs_trips.id'], ondelete='CASCADE', name='gtfs_stops_times_trip_id_fkey'),
+        PrimaryKeyConstraint('trip_id', 'stop_sequence', name='gtfs_stops_times_pkey', postgresql_include=['stop_id', 'arrival_time', 'departure_time']),
+        Index('gtfs_stops_times_stop_id_idx', 'stop_id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
-    trip_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
+    trip_id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
     stop_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
-    arrival_time: Mapped[Optional[str]] = mapped_column(Text)
-    departure_time: Mapped[Optional[str]] = mapped_column(Text)
-    stop_sequence: Mapped[Optional[int]] = mapped_column(Integer)
+    arrival_time: Mapped[Optional[str]] = mapped_column(GtfsTime)
+    departure_time: Mapped[Optional[str]] = mapped_column(GtfsTime)
+    stop_sequence: Mapped[int] = mapped_column(Integer, primary_key=True)
     stop_headsign: Mapped[Optional[str]] = mapped_column(Text)
-    pickup_type: Mapped[Optional[int]] = mapped_column(Integer)
-    drop_off_type: Mapped[Optional[int]] = mapped_column(Integer)
+    pickup_type: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    drop_off_type: Mapped[Optional[int]] = mapped_column(SmallInteger)
     shape_dist_traveled: Mapped[Optional[float]] = mapped_column(Double(53))
-    timepoint: Mapped[Optional[int]] = mapped_column(Integer)
-    continuous_pickup: Mapped[Optional[int]] = mapped_column(Integer)
-    continuous_drop_off: Mapped[Optional[int]] = mapped_column(Integer)
+    timepoint: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    continuous_pickup: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    continuous_drop_off: Mapped[Optional[int]] = mapped_column(SmallInteger)
 
     stop: Mapped['GtfsStops'] = relationship('GtfsStops', back_populates='gtfs_stops_times')
     trip: Mapped['GtfsTrips'] = relationship('GtfsTrips', back_populates='gtfs_stops_times')
@@ -309,16 +314,17 @@ class SimulationRuns(Base):
         ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL', name='simulation_runs_user_id_fkey'),
         ForeignKeyConstraint(['variant_id'], ['variants.id'], ondelete='CASCADE', name='simulation_runs_variant_id_fkey'),
         PrimaryKeyConstraint('id', name='simulation_runs_pkey'),
+        Index('simulation_runs_active_idx', 'created_at', postgresql_where=text("status = ANY (ARRAY['pending'::sim_status, 'running'::sim_status])")),
         Index('simulation_runs_variant_id_idx', 'variant_id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     input_params: Mapped[dict] = mapped_column(JSONB, nullable=False)
-    status: Mapped[str] = mapped_column(Enum('pending', 'running', 'completed', 'failed', name='sim_status'), nullable=False, server_default=text("'pending'::sim_status"))
+    status: Mapped[str] = mapped_column(SIM_STATUS, nullable=False, server_default=text("'pending'::sim_status"))
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, server_default=text('now()'))
     variant_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
-    optimal_battery_kwh: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
+    optimal_battery_kwh: Mapped[Optional[float]] = mapped_column(Double(53))
     output_results: Mapped[Optional[dict]] = mapped_column(JSONB)
     completed_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(True))
 
@@ -335,12 +341,12 @@ class Shifts(Base):
         Index('shifts_name_idx', 'name')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(Text, nullable=False)
     bus_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid)
 
     bus: Mapped[Optional['Buses']] = relationship('Buses', back_populates='shifts')
-    shifts_structures: Mapped[list['ShiftsStructures']] = relationship('ShiftsStructures', back_populates='shift')
+    shifts_structures: Mapped[list['ShiftsStructures']] = relationship('ShiftsStructures', back_populates='shift', passive_deletes=True)
 
 
 class ShiftsStructures(Base):
@@ -355,7 +361,7 @@ class ShiftsStructures(Base):
         Index('shifts_structures_trip_idx', 'trip_id')
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, server_default=text('gen_random_uuid()'))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     trip_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     shift_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     sequence_number: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -4,7 +4,7 @@ from sqlalchemy import select, or_
 from typing import List
 from uuid import UUID
 
-from app.database import get_async_session
+from app.database import columns_for, get_async_session
 from app.schemas.database import (
     UsersCreate, UsersRead, UsersUpdate,
     GtfsAgenciesCreate, GtfsAgenciesRead,
@@ -12,16 +12,20 @@ from app.schemas.database import (
 from app.models import (
     Users, GtfsAgencies
 )
-from app.core.auth import get_current_user, require_admin, get_password_hash
+from app.core.auth import bump_user, require_admin, get_password_hash, verify_jwt_token
 
 router = APIRouter()
 
+# List queries select exactly the response columns as plain rows, no ORM instances,
+# and walk users_created_at_idx / gtfs_agency_agency_name_idx in a stable order
+_USERS_LIST = select(*columns_for(Users, UsersRead)).order_by(Users.created_at.desc(), Users.id.desc())
+_AGENCIES_LIST = select(*columns_for(GtfsAgencies, GtfsAgenciesRead)).order_by(GtfsAgencies.agency_name, GtfsAgencies.id)
+
 # Users endpoints (admin only)
 @router.get("/users/", response_model=List[UsersRead], dependencies=[Depends(require_admin)])
 async def read_users(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session)):
-    result = await db.execute(select(Users).offset(skip).limit(limit))
-    users = result.scalars().all()
-    return users
+    result = await db.execute(_USERS_LIST.offset(skip).limit(limit))
+    return result.mappings().all()
 
 @router.get("/users/{user_id}", response_model=UsersRead, dependencies=[Depends(require_admin)])
 async def read_user(user_id: UUID, db: AsyncSession = Depends(get_async_session)):
@@ -35,12 +39,11 @@ async def create_user(user: UsersCreate, db: AsyncSession = Depends(get_async_se
     # Hash the password if provided
     user_data = user.model_dump(exclude_unset=True)
     if 'password' in user_data:
-        user_data['password_hash'] = get_password_hash(user_data.pop('password'))
+        user_data['password_hash'] = await get_password_hash(user_data.pop('password'))
 
     db_user = Users(**user_data)
     db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
     return db_user
 
 @router.put("/users/{user_id}", response_model=UsersRead, dependencies=[Depends(require_admin)])
@@ -54,14 +57,14 @@ async def update_user(user_id: UUID, user_update: UsersUpdate, db: AsyncSession
         setattr(db_user, field, value)
 
     await db.commit()
-    await db.refresh(db_user)
+    bump_user(user_id)
     return db_user
 
 # GTFS Agencies endpoints (authenticated users only)
 @router.get("/agencies/", response_model=List[GtfsAgenciesRead])
 async def read_agencies(skip: int = 0, limit: int = 100, search: str = "", db: AsyncSession = Depends(get_async_session)):
     """List all agencies - public endpoint for registration"""
-    query = select(GtfsAgencies).order_by(GtfsAgencies.agency_name)
+    query = _AGENCIES_LIST
     
     # Add search filter if provided
     if search:
@@ -75,20 +78,18 @@ async def read_agencies(skip: int = 0, limit: int = 100, search: str = "", db: A
     
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    agencies = result.scalars().all()
-    return agencies
+    return result.mappings().all()
 
 @router.get("/agencies/{agency_id}", response_model=GtfsAgenciesRead)
-async def read_agency(agency_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_agency(agency_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     agency = await db.get(GtfsAgencies, agency_id)
     if agency is None:
         raise HTTPException(status_code=404, detail="Agency not found")
     return agency
 
 @router.post("/agencies/", response_model=GtfsAgenciesRead)
-async def create_agency(agency: GtfsAgenciesCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_agency(agency: GtfsAgenciesCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_agency = GtfsAgencies(**agency.model_dump(exclude_unset=True))
     db.add(db_agency)
     await db.commit()
-    await db.refresh(db_agency)
     return db_agency
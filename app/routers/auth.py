@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response
 from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import IntegrityError
 from datetime import timedelta
 
@@ -19,20 +19,25 @@ from app.schemas.database import UsersRead
 from app.models import Users
 from app.core.auth import (
     authenticate_user,
+    bump_user,
     create_access_token,
     get_password_hash,
-    get_current_user,
+    load_password_hash,
+    verify_jwt_token,
     verify_password
 )
-from app.core.config import get_settings
+from app.core.config import get_cached_settings
 
 router = APIRouter()
-settings = get_settings()
+settings = get_cached_settings()
+
+# Email availability probe shared by check-email, register and profile updates
+_EMAIL_TAKEN = select(Users.id).where(Users.email == bindparam("email"))
 
 @router.get("/check-email/{email}")
 async def check_email_availability(email: str, db: AsyncSession = Depends(get_async_session)):
     """Check if an email is available for registration"""
-    result = await db.execute(select(Users).where(Users.email == email))
+    result = await db.execute(_EMAIL_TAKEN, {"email": email})
     existing_user = result.scalar_one_or_none()
     
     return {"available": existing_user is None}
@@ -41,7 +46,7 @@ async def check_email_availability(email: str, db: AsyncSession = Depends(get_as
 async def register(user_data: UserRegister, db: AsyncSession = Depends(get_async_session)):
     """Register a new user"""
     # Check if user already exists
-    result = await db.execute(select(Users).where(Users.email == user_data.email))
+    result = await db.execute(_EMAIL_TAKEN, {"email": user_data.email})
     existing_user = result.scalar_one_or_none()
 
     if existing_user:
@@ -51,7 +56,7 @@ async def register(user_data: UserRegister, db: AsyncSession = Depends(get_async
         )
 
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
     db_user = Users(
         company_id=user_data.company_id,
         email=user_data.email,
@@ -62,7 +67,6 @@ async def register(user_data: UserRegister, db: AsyncSession = Depends(get_async
 
     db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
     return db_user
 
 @router.post("/login", response_model=Token)
@@ -81,8 +85,8 @@ async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_asyn
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
-@router.get("/me", response_model=UsersRead)
-async def read_users_me(current_user: Users = Depends(get_current_user)):
+@router.get("/me", response_model=UserProfileRead)
+async def read_users_me(current_user: Users = Depends(verify_jwt_token)):
     """Get current user information"""
     return current_user
 
@@ -90,14 +94,14 @@ async def read_users_me(current_user: Users = Depends(get_current_user)):
 async def update_user_profile(
     user_update: UserUpdate, 
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user)
+    current_user: Users = Depends(verify_jwt_token)
 ):
     """Update current user profile information"""
     update_data = user_update.model_dump(exclude_unset=True)
     
     # Check if email is being changed and if it already exists
     if 'email' in update_data and update_data['email'] != current_user.email:
-        result = await db.execute(select(Users).where(Users.email == update_data['email']))
+        result = await db.execute(_EMAIL_TAKEN, {"email": update_data['email']})
         existing_user = result.scalar_one_or_none()
         if existing_user:
             raise HTTPException(
@@ -110,7 +114,7 @@ async def update_user_profile(
         setattr(current_user, field, value)
     
     await db.commit()
-    await db.refresh(current_user)
+    bump_user(current_user.id)
     
     return UserProfileRead(
         id=current_user.id,
@@ -125,40 +129,44 @@ async def update_user_profile(
 async def update_user_password(
     password_update: UserPasswordUpdate,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user)
+    current_user: Users = Depends(verify_jwt_token)
 ):
     """Update current user password"""
     # Verify current password
-    if not verify_password(password_update.current_password, current_user.password_hash):
+    password_hash = await load_password_hash(db, current_user.id)
+    if password_hash is None or not await verify_password(password_update.current_password, password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Update password (validation is handled by Pydantic)
-    current_user.password_hash = get_password_hash(password_update.new_password)
+    current_user.password_hash = await get_password_hash(password_update.new_password)
     await db.commit()
+    bump_user(current_user.id)
     
     return {"message": "Password updated successfully"}
 
 
 @router.post("/logout", response_model=LogoutResponse)
-async def logout(current_user: Users = Depends(get_current_user)):
+async def logout(current_user: Users = Depends(verify_jwt_token)):
     """Logout user (client should remove token from storage)"""
     return {"message": "Successfully logged out"}
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_current_user(
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user)
+    current_user: Users = Depends(verify_jwt_token)
 ):
     """Delete the current user account.
 
     Note: This will fail with 409 if the user has related records due to FK constraints.
     """
+    user_id = current_user.id
     try:
         await db.delete(current_user)
         await db.commit()
+        bump_user(user_id)
     except IntegrityError:
         await db.rollback()
         raise HTTPException(
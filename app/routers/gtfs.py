@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
+from sqlalchemy.orm import raiseload
+from functools import lru_cache
 from typing import List, Optional
 from datetime import date
 from uuid import UUID, uuid4
@@ -22,7 +24,7 @@ from app.models import (
     GtfsStops, GtfsTrips, Variants,
     GtfsStopsTimes, GtfsRoutes
 )
-from app.core.auth import get_current_user
+from app.core.auth import verify_jwt_token
 from minio import Minio
 import pandas as pd
 import io
@@ -45,6 +47,71 @@ except ImportError:
 
 router = APIRouter()
 
+# Hot GTFS lookups built once at import and executed with bound parameters,
+# so requests skip statement construction and reuse the compiled form.
+# Trip listings return flat rows: raiseload("*") turns any relationship access
+# into an error instead of a hidden query.
+_STOPS_BY_TRIP = (
+    select(GtfsStops, GtfsStopsTimes.arrival_time, GtfsStopsTimes.departure_time)
+    .join(GtfsStopsTimes, GtfsStops.id == GtfsStopsTimes.stop_id)
+    .where(GtfsStopsTimes.trip_id == bindparam("trip_id"))
+    .order_by(GtfsStopsTimes.stop_sequence)
+)
+_TRIPS_BY_STOP = (
+    select(GtfsTrips)
+    .join(GtfsStopsTimes, GtfsTrips.id == GtfsStopsTimes.trip_id)
+    .where(GtfsStopsTimes.stop_id == bindparam("stop_id"), GtfsTrips.status == bindparam("status"))
+    .options(raiseload("*"))
+)
+# Latest (gtfs_year, gtfs_file_date) feed of an agency, one backward scan of
+# gtfs_routes_agency_feed_idx
+_AGENCY_LATEST_FEED = (
+    select(GtfsRoutes.gtfs_year, GtfsRoutes.gtfs_file_date)
+    .where(GtfsRoutes.agency_id == bindparam("agency_id"))
+    .order_by(GtfsRoutes.gtfs_year.desc(), GtfsRoutes.gtfs_file_date.desc())
+    .limit(1)
+)
+_AGENCY_LATEST_FILE_DATE = select(func.max(GtfsRoutes.gtfs_file_date)).where(
+    GtfsRoutes.agency_id == bindparam("agency_id"),
+    GtfsRoutes.gtfs_year == bindparam("gtfs_year"),
+)
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+@lru_cache(maxsize=len(_WEEKDAYS) + 1)
+def _trips_by_route_stmt(day: Optional[str]):
+    """Trips of a route with a given status, optionally only those running on `day`"""
+    query = select(GtfsTrips).where(
+        GtfsTrips.route_id == bindparam("route_id"),
+        GtfsTrips.status == bindparam("status"),
+    ).options(raiseload("*"))
+    if day is not None:
+        query = (
+            query.join(GtfsCalendar, GtfsTrips.service_id == GtfsCalendar.id)
+            .where(getattr(GtfsCalendar, day) == 1)
+        )
+    return query
+
+async def _resolve_agency_feed(
+    db: AsyncSession,
+    agency_id: UUID,
+    gtfs_year: Optional[int],
+    gtfs_file_date: Optional[date],
+) -> Optional[tuple[int, date]]:
+    """Default to the agency's latest year and, within it, latest file date; None if it has no routes"""
+    if gtfs_year is None:
+        latest = (await db.execute(_AGENCY_LATEST_FEED, {"agency_id": agency_id})).first()
+        if latest is None:
+            return None
+        gtfs_year = latest.gtfs_year
+        if gtfs_file_date is None:
+            gtfs_file_date = latest.gtfs_file_date
+    elif gtfs_file_date is None:
+        gtfs_file_date = (await db.execute(
+            _AGENCY_LATEST_FILE_DATE, {"agency_id": agency_id, "gtfs_year": gtfs_year}
+        )).scalar()
+        if gtfs_file_date is None:
+            return None
+    return gtfs_year, gtfs_file_date
 
 
 # GTFS Routes endpoints (authenticated users only)
@@ -55,7 +122,7 @@ async def read_routes(
     gtfs_year: Optional[int] = None,
     gtfs_file_date: Optional[date] = None,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user),
+    current_user: Users = Depends(verify_jwt_token),
 ):
     # Resolve defaults: latest year, and within year latest file date
     resolved_year = gtfs_year
@@ -91,18 +158,17 @@ async def read_routes(
     return routes
 
 @router.get("/gtfs-routes/{route_id}", response_model=GtfsRoutesRead)
-async def read_route(route_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_route(route_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     route = await db.get(GtfsRoutes, route_id)
     if route is None:
         raise HTTPException(status_code=404, detail="Route not found")
     return route
 
 @router.post("/gtfs-routes/", response_model=GtfsRoutesRead)
-async def create_route(route: GtfsRoutesCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_route(route: GtfsRoutesCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_route = GtfsRoutes(**route.model_dump(exclude_unset=True))
     db.add(db_route)
     await db.commit()
-    await db.refresh(db_route)
     return db_route
 
 @router.get("/gtfs-routes/by-agency/{agency_id}", response_model=List[GtfsRoutesRead])
@@ -111,31 +177,13 @@ async def read_routes_by_agency(
     gtfs_year: Optional[int] = None,
     gtfs_file_date: Optional[date] = None,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user),
+    current_user: Users = Depends(verify_jwt_token),
 ):
     # Resolve defaults constrained to agency scope
-    resolved_year = gtfs_year
-    if resolved_year is None:
-        res = await db.execute(
-            select(func.max(GtfsRoutes.gtfs_year)).filter(GtfsRoutes.agency_id == agency_id)
-        )
-        resolved_year = res.scalar()
-
-    if resolved_year is None:
-        return []
-
-    resolved_file_date = gtfs_file_date
-    if resolved_file_date is None:
-        res = await db.execute(
-            select(func.max(GtfsRoutes.gtfs_file_date)).filter(
-                GtfsRoutes.agency_id == agency_id,
-                GtfsRoutes.gtfs_year == resolved_year,
-            )
-        )
-        resolved_file_date = res.scalar()
-
-    if resolved_file_date is None:
+    feed = await _resolve_agency_feed(db, agency_id, gtfs_year, gtfs_file_date)
+    if feed is None:
         return []
+    resolved_year, resolved_file_date = feed
 
     result = await db.execute(
         select(GtfsRoutes)
@@ -155,7 +203,7 @@ async def read_routes_by_agency_with_variant_1(
     gtfs_year: Optional[int] = None,
     gtfs_file_date: Optional[date] = None,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user),
+    current_user: Users = Depends(verify_jwt_token),
 ):
     """Get all routes for an agency with variant number 1 data included"""
     # Import settings here to avoid circular imports
@@ -167,28 +215,10 @@ async def read_routes_by_agency_with_variant_1(
     settings = get_cached_settings()
 
     # Resolve defaults constrained to agency scope
-    resolved_year = gtfs_year
-    if resolved_year is None:
-        tmp = await db.execute(
-            select(func.max(GtfsRoutes.gtfs_year)).filter(GtfsRoutes.agency_id == agency_id)
-        )
-        resolved_year = tmp.scalar()
-
-    if resolved_year is None:
-        return []
-
-    resolved_file_date = gtfs_file_date
-    if resolved_file_date is None:
-        tmp = await db.execute(
-            select(func.max(GtfsRoutes.gtfs_file_date)).filter(
-                GtfsRoutes.agency_id == agency_id,
-                GtfsRoutes.gtfs_year == resolved_year,
-            )
-        )
-        resolved_file_date = tmp.scalar()
-
-    if resolved_file_date is None:
+    feed = await _resolve_agency_feed(db, agency_id, gtfs_year, gtfs_file_date)
+    if feed is None:
         return []
+    resolved_year, resolved_file_date = feed
 
     # Query to get all routes for the agency with their variant 1 data
     result = await db.execute(
@@ -278,7 +308,7 @@ async def read_routes_by_agency_with_largest_variant(
     gtfs_year: Optional[int] = None,
     gtfs_file_date: Optional[date] = None,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user),
+    current_user: Users = Depends(verify_jwt_token),
 ):
     """Get all routes for an agency with the largest variant data included (based on elevation_data.csv file size)"""
     # Import settings here to avoid circular imports
@@ -291,28 +321,10 @@ async def read_routes_by_agency_with_largest_variant(
     settings = get_cached_settings()
 
     # Resolve defaults constrained to agency scope
-    resolved_year = gtfs_year
-    if resolved_year is None:
-        tmp = await db.execute(
-            select(func.max(GtfsRoutes.gtfs_year)).filter(GtfsRoutes.agency_id == agency_id)
-        )
-        resolved_year = tmp.scalar()
-
-    if resolved_year is None:
-        return []
-
-    resolved_file_date = gtfs_file_date
-    if resolved_file_date is None:
-        tmp = await db.execute(
-            select(func.max(GtfsRoutes.gtfs_file_date)).filter(
-                GtfsRoutes.agency_id == agency_id,
-                GtfsRoutes.gtfs_year == resolved_year,
-            )
-        )
-        resolved_file_date = tmp.scalar()
-
-    if resolved_file_date is None:
+    feed = await _resolve_agency_feed(db, agency_id, gtfs_year, gtfs_file_date)
+    if feed is None:
         return []
+    resolved_year, resolved_file_date = feed
 
     # First, get all routes for the agency and their variants
     result = await db.execute(
@@ -459,7 +471,7 @@ async def read_routes_by_stop(
     gtfs_year: Optional[int] = None,
     gtfs_file_date: Optional[date] = None,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user)
+    current_user: Users = Depends(verify_jwt_token)
 ):
     """Get all unique GTFS routes for a given stop ID, optionally filtered by agency"""
     base_filters = [GtfsStopsTimes.stop_id == stop_id]
@@ -524,40 +536,24 @@ async def read_trips_by_route(
     day_of_week: Optional[str] = None,
     status: TripStatus = TripStatus.GTFS,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user),
+    current_user: Users = Depends(verify_jwt_token),
 ):
-    query = select(GtfsTrips).filter(
-        GtfsTrips.route_id == route_id,
-        GtfsTrips.status == status.value
-    )
-
+    day = None
     if day_of_week is not None:
         day = day_of_week.strip().lower()
-        valid_days = {
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-        }
-        if day not in valid_days:
+        if day not in _WEEKDAYS:
             raise HTTPException(status_code=400, detail="Invalid day_of_week. Use monday..sunday")
 
-        query = (
-            query.join(GtfsCalendar, GtfsTrips.service_id == GtfsCalendar.id)
-            .filter(getattr(GtfsCalendar, day) == 1)
-        )
-
-    result = await db.execute(query)
+    result = await db.execute(
+        _trips_by_route_stmt(day), {"route_id": route_id, "status": status.value}
+    )
     trips = result.scalars().all()
     return trips
 
 
 # GTFS Trips CUD endpoints (authenticated users only)
 @router.post("/gtfs-trips/", response_model=GtfsTripsRead)
-async def create_trip(trip: GtfsTripsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_trip(trip: GtfsTripsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     # Validate status against enum values to provide clear error messages
     if trip.status not in {s.value for s in TripStatus}:
         raise HTTPException(status_code=400, detail=f"Invalid status. Allowed: {[s.value for s in TripStatus]}")
@@ -565,12 +561,11 @@ async def create_trip(trip: GtfsTripsCreate, db: AsyncSession = Depends(get_asyn
     db_trip = GtfsTrips(**trip.model_dump(exclude_unset=True))
     db.add(db_trip)
     await db.commit()
-    await db.refresh(db_trip)
     return db_trip
 
 
 @router.put("/gtfs-trips/{trip_pk}", response_model=GtfsTripsRead)
-async def update_trip(trip_pk: UUID, trip_update: GtfsTripsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def update_trip(trip_pk: UUID, trip_update: GtfsTripsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_trip = await db.get(GtfsTrips, trip_pk)
     if db_trip is None:
         raise HTTPException(status_code=404, detail="Trip not found")
@@ -586,30 +581,23 @@ async def update_trip(trip_pk: UUID, trip_update: GtfsTripsUpdate, db: AsyncSess
         setattr(db_trip, field, value)
 
     await db.commit()
-    await db.refresh(db_trip)
     return db_trip
 
 
 @router.delete("/gtfs-trips/{trip_pk}")
-async def delete_trip(trip_pk: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def delete_trip(trip_pk: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_trip = await db.get(GtfsTrips, trip_pk)
     if db_trip is None:
         raise HTTPException(status_code=404, detail="Trip not found")
 
-    # Delete associated stop_times first to avoid foreign key constraint violation
-    result = await db.execute(select(GtfsStopsTimes).filter(GtfsStopsTimes.trip_id == trip_pk))
-    stop_times = result.scalars().all()
-    for st in stop_times:
-        await db.delete(st)
-
-    # Delete the trip
+    # Stop times and shift structures go with it through ON DELETE CASCADE
     await db.delete(db_trip)
     await db.commit()
     return {"message": "Trip deleted successfully"}
 
 # Variants endpoints (authenticated users only)
 @router.get("/variants/by-route/{route_id}", response_model=List[VariantsReadWithRoute])
-async def read_variants_by_route(route_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_variants_by_route(route_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     """Get all variants for a given route ID with elevation data included"""
     # Import settings here to avoid circular imports
     from app.core.config import get_cached_settings
@@ -689,7 +677,7 @@ async def read_variants_by_route(route_id: UUID, db: AsyncSession = Depends(get_
     return variants_with_elevation
 
 @router.get("/variants/{route_id}/{variant_num}", response_model=VariantsReadWithRoute)
-async def read_variant_by_route_and_number(route_id: UUID, variant_num: int, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_variant_by_route_and_number(route_id: UUID, variant_num: int, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     """Get a specific variant by route ID and variant number, including the GTFS route ID and elevation file path"""
     # Import settings here to avoid circular imports
     from app.core.config import get_cached_settings
@@ -768,7 +756,7 @@ async def read_variant_by_route_and_number(route_id: UUID, variant_num: int, db:
 
 # GTFS Calendar endpoints (authenticated users only)
 @router.get("/gtfs-calendar/by-trip/{trip_id}", response_model=List[GtfsCalendarRead])
-async def read_calendar_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_calendar_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     result = await db.execute(
         select(GtfsCalendar).filter(GtfsCalendar.trip_id == trip_id)
     )
@@ -777,18 +765,9 @@ async def read_calendar_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_as
 
 # GTFS Stops endpoints (authenticated users only)
 @router.get("/gtfs-stops/by-trip/{trip_id}", response_model=List[GtfsStopsReadWithTimes])
-async def read_stops_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_stops_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     """Get all GTFS stops for a given trip ID"""
-    result = await db.execute(
-        select(
-            GtfsStops,
-            GtfsStopsTimes.arrival_time,
-            GtfsStopsTimes.departure_time
-        )
-        .join(GtfsStopsTimes, GtfsStops.id == GtfsStopsTimes.stop_id)
-        .filter(GtfsStopsTimes.trip_id == trip_id)
-        .order_by(GtfsStopsTimes.stop_sequence)
-    )
+    result = await db.execute(_STOPS_BY_TRIP, {"trip_id": trip_id})
     rows = result.all()
     return [
         GtfsStopsReadWithTimes(
@@ -816,23 +795,22 @@ async def read_stops_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_async
 
 # Basic CRUD for GTFS stops (authenticated users only)
 @router.post("/gtfs-stops/", response_model=GtfsStopsRead)
-async def create_gtfs_stop(stop: GtfsStopsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_gtfs_stop(stop: GtfsStopsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_stop = GtfsStops(**stop.model_dump(exclude_unset=True))
     db.add(db_stop)
     await db.commit()
-    await db.refresh(db_stop)
     return db_stop
 
 
 @router.get("/gtfs-stops/", response_model=List[GtfsStopsRead])
-async def read_gtfs_stops(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
-    result = await db.execute(select(GtfsStops).offset(skip).limit(limit))
+async def read_gtfs_stops(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
+    result = await db.execute(select(GtfsStops).options(raiseload("*")).offset(skip).limit(limit))
     stops = result.scalars().all()
     return stops
 
 
 @router.get("/gtfs-stops/{stop_pk}", response_model=GtfsStopsRead)
-async def read_gtfs_stop(stop_pk: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_gtfs_stop(stop_pk: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     stop = await db.get(GtfsStops, stop_pk)
     if stop is None:
         raise HTTPException(status_code=404, detail="Stop not found")
@@ -840,7 +818,7 @@ async def read_gtfs_stop(stop_pk: UUID, db: AsyncSession = Depends(get_async_ses
 
 
 @router.put("/gtfs-stops/{stop_pk}", response_model=GtfsStopsRead)
-async def update_gtfs_stop(stop_pk: UUID, stop_update: GtfsStopsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def update_gtfs_stop(stop_pk: UUID, stop_update: GtfsStopsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     stop = await db.get(GtfsStops, stop_pk)
     if stop is None:
         raise HTTPException(status_code=404, detail="Stop not found")
@@ -848,12 +826,11 @@ async def update_gtfs_stop(stop_pk: UUID, stop_update: GtfsStopsUpdate, db: Asyn
     for field, value in update_data.items():
         setattr(stop, field, value)
     await db.commit()
-    await db.refresh(stop)
     return stop
 
 
 @router.delete("/gtfs-stops/{stop_pk}")
-async def delete_gtfs_stop(stop_pk: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def delete_gtfs_stop(stop_pk: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     stop = await db.get(GtfsStops, stop_pk)
     if stop is None:
         raise HTTPException(status_code=404, detail="Stop not found")
@@ -866,17 +843,10 @@ async def read_trips_by_stop(
     stop_id: UUID, 
     status: TripStatus = TripStatus.GTFS,
     db: AsyncSession = Depends(get_async_session), 
-    current_user: Users = Depends(get_current_user)
+    current_user: Users = Depends(verify_jwt_token)
 ):
     """Get all GTFS trips for a given stop ID"""
-    result = await db.execute(
-        select(GtfsTrips)
-        .join(GtfsStopsTimes, GtfsTrips.id == GtfsStopsTimes.trip_id)
-        .filter(
-            GtfsStopsTimes.stop_id == stop_id,
-            GtfsTrips.status == status.value
-        )
-    )
+    result = await db.execute(_TRIPS_BY_STOP, {"stop_id": stop_id, "status": status.value})
     trips = result.scalars().all()
     return trips
 
@@ -891,7 +861,7 @@ async def get_driving_distance_to_stop(
     coord_sys: str = "wgs84",  # "wgs84" (EPSG:4326), "lv95" (EPSG:2056), "lv03" (EPSG:21781)
     include_geometry: str = "false",  # Include full route geometry as lat/lon points ("true" or "false")
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user),
+    current_user: Users = Depends(verify_jwt_token),
 ):
     """Return OSRM driving distance and duration between a coordinate and a GTFS stop.
 
@@ -997,7 +967,7 @@ async def get_driving_distance_to_stop(
 
 # Elevation profile by trip
 @router.get("/elevation-profile/by-trip/{trip_id}", response_model=ElevationProfileResponse)
-async def get_elevation_profile_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def get_elevation_profile_by_trip(trip_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     """Fetch elevation profile parquet by trip's shape_id from MinIO and return as JSON records"""
     # 1) Find the trip to get shape_id
     trip = await db.get(GtfsTrips, trip_id)
@@ -1046,7 +1016,7 @@ async def get_elevation_profile_by_trip(trip_id: UUID, db: AsyncSession = Depend
 async def create_aux_trip(
     req: AuxTripCreate,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user),
+    current_user: Users = Depends(verify_jwt_token),
 ):
     # 1) Fetch departure and arrival stops
     dep_stop = await db.get(GtfsStops, req.departure_stop_id)
@@ -1177,8 +1147,7 @@ async def create_aux_trip(
         arrival_time=req.arrival_time,
     )
     db.add(trip)
-    await db.commit()
-    await db.refresh(trip)
+    await db.flush()
 
     # 7) Create stop_times entries
     st1 = GtfsStopsTimes(
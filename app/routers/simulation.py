@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, select, func
+from sqlalchemy.orm import raiseload
+from functools import partial
+import datetime
 from typing import List
 from uuid import UUID
 import numpy as np
 import pandas as pd
 
-from app.database import get_async_session
+from app.database import copy_rows, gather_with_sessions, get_async_session
 from app.schemas.database import (
     SimulationRunsCreate, SimulationRunsRead, SimulationRunsUpdate,
 )
@@ -17,7 +20,7 @@ from app.models import (
     Users, SimulationRuns, WeatherMeasurements,
     GtfsTrips, GtfsStops, GtfsStopsTimes
 )
-from app.core.auth import get_current_user
+from app.core.auth import verify_jwt_token
 from app.utils.trip_statistics import (
     compute_global_trip_statistics_combined,
     extract_stop_to_stop_statistics_for_schedule,
@@ -26,30 +29,76 @@ from app.utils.trip_statistics import (
 
 router = APIRouter()
 
+# Hourly TMY values of one location as plain rows keyed like PVGIS records, so a
+# cached year of weather is read without building 8760 ORM objects
+_TMY_RECORDS = (
+    select(
+        WeatherMeasurements.temp_air,
+        WeatherMeasurements.relative_humidity,
+        WeatherMeasurements.ghi,
+        WeatherMeasurements.dni,
+        WeatherMeasurements.dhi,
+        WeatherMeasurements.ir_h.label("IR(h)"),
+        WeatherMeasurements.wind_speed,
+        WeatherMeasurements.wind_direction,
+        WeatherMeasurements.pressure,
+    )
+    .where(
+        WeatherMeasurements.latitude == bindparam("latitude"),
+        WeatherMeasurements.longitude == bindparam("longitude"),
+    )
+    .order_by(WeatherMeasurements.time_utc)
+)
+
+def _optional(value, cast=float):
+    return cast(value) if pd.notna(value) else None
+
+def _tmy_weather_rows(records, latitude: float, longitude: float, year: int):
+    """Yield weather_measurements rows for PVGIS TMY records, one per hour of `year`"""
+    # TMY data represents a typical year: hour i of the series is hour i of `year`
+    start = datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc)
+    for hour, row in enumerate(records):
+        wind_direction = _optional(row['wind_direction'])
+        yield dict(
+            time_utc=start + datetime.timedelta(hours=hour),
+            latitude=latitude,
+            longitude=longitude,
+            temp_air=_optional(row['temp_air']),
+            relative_humidity=_optional(row['relative_humidity']),
+            ghi=_optional(row['ghi']),
+            dni=_optional(row['dni']),
+            dhi=_optional(row['dhi']),
+            ir_h=_optional(row['IR(h)']),
+            wind_speed=_optional(row['wind_speed']),
+            # Normalize 360 to 0
+            wind_direction=wind_direction % 360.0 if wind_direction is not None else None,
+            pressure=_optional(row['pressure'], int),
+        )
+
 # Simulation Runs endpoints (authenticated users only)
 @router.post("/simulation-runs/", response_model=SimulationRunsRead)
-async def create_simulation_run(sim_run: SimulationRunsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_simulation_run(sim_run: SimulationRunsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_sim_run = SimulationRuns(**sim_run.model_dump(exclude_unset=True))
     db.add(db_sim_run)
     await db.commit()
-    await db.refresh(db_sim_run)
     return db_sim_run
 
 @router.get("/simulation-runs/", response_model=List[SimulationRunsRead])
-async def read_simulation_runs(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
-    result = await db.execute(select(SimulationRuns).offset(skip).limit(limit))
+async def read_simulation_runs(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
+    # Flat listing: forbid implicit lazy loads
+    result = await db.execute(select(SimulationRuns).options(raiseload("*")).offset(skip).limit(limit))
     sim_runs = result.scalars().all()
     return sim_runs
 
 @router.get("/simulation-runs/{run_id}", response_model=SimulationRunsRead)
-async def read_simulation_run(run_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_simulation_run(run_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     sim_run = await db.get(SimulationRuns, run_id)
     if sim_run is None:
         raise HTTPException(status_code=404, detail="Simulation run not found")
     return sim_run
 
 @router.put("/simulation-runs/{run_id}", response_model=SimulationRunsRead)
-async def update_simulation_run(run_id: UUID, sim_run_update: SimulationRunsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def update_simulation_run(run_id: UUID, sim_run_update: SimulationRunsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_sim_run = await db.get(SimulationRuns, run_id)
     if db_sim_run is None:
         raise HTTPException(status_code=404, detail="Simulation run not found")
@@ -59,7 +108,6 @@ async def update_simulation_run(run_id: UUID, sim_run_update: SimulationRunsUpda
         setattr(db_sim_run, field, value)
 
     await db.commit()
-    await db.refresh(db_sim_run)
     return db_sim_run
 
 @router.get("/simulation-runs/{run_id}/results", response_model=SimulationRunResults)
@@ -67,7 +115,7 @@ async def get_simulation_run_results(
     run_id: UUID,
     keys: str = None,  # Optional comma-separated list of keys to filter
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user)
+    current_user: Users = Depends(verify_jwt_token)
 ):
     """
     Get simulation run output results, either complete or filtered by specific keys.
@@ -81,37 +129,37 @@ async def get_simulation_run_results(
     Returns:
         SimulationRunResults with either complete or filtered output_results
     """
-    # Get the simulation run
-    sim_run = await db.get(SimulationRuns, run_id)
+    # One round trip: the run's metadata plus only the part of output_results that
+    # is returned. With keys, Postgres extracts them from an object document
+    # (has_key keeps explicit JSON nulls) and ships the whole document only when it
+    # is not an object and so cannot be filtered
+    requested_keys = [key.strip() for key in keys.split(',')] if keys else None
+    doc = SimulationRuns.output_results
+    results_kind = func.jsonb_typeof(doc)
+    columns = [SimulationRuns.id, SimulationRuns.status, SimulationRuns.completed_at, results_kind]
+    if requested_keys:
+        columns.append(case((results_kind != 'object', doc)))
+        for key in requested_keys:
+            columns.extend((doc.has_key(key), doc[key]))
+    else:
+        columns.append(doc)
+    result = await db.execute(select(*columns).where(SimulationRuns.id == run_id))
+    sim_run = result.one_or_none()
     if sim_run is None:
         raise HTTPException(status_code=404, detail="Simulation run not found")
 
-    requested_keys = None
-
-    # Check if output_results exists
-    if sim_run.output_results is None:
+    kind = sim_run[3]
+    if kind is None or kind == 'null':
         output_results = None
-    elif keys:
-        # Filter output_results by requested keys
-        requested_keys = [key.strip() for key in keys.split(',')]
-
-        # Handle both dict and list cases for output_results
-        if isinstance(sim_run.output_results, dict):
-            # Filter dictionary keys
-            filtered_results = {}
-            for key in requested_keys:
-                if key in sim_run.output_results:
-                    filtered_results[key] = sim_run.output_results[key]
-            output_results = filtered_results if filtered_results else None
-        elif isinstance(sim_run.output_results, list):
-            # For list results, return the original list but note the requested keys
-            output_results = sim_run.output_results
-            # Note: For list results, we can't filter by keys, so we return all data
-        else:
-            output_results = sim_run.output_results
+    elif requested_keys and kind == 'object':
+        values = sim_run[5:]
+        filtered_results = {
+            key: values[2 * i + 1] for i, key in enumerate(requested_keys) if values[2 * i]
+        }
+        output_results = filtered_results if filtered_results else None
     else:
-        # Return all output_results
-        output_results = sim_run.output_results
+        # Full document: no keys requested, or a list that cannot be filtered by keys
+        output_results = sim_run[4]
 
     # Create response
     return SimulationRunResults(
@@ -124,15 +172,13 @@ async def get_simulation_run_results(
 
 # PVGIS TMY endpoint (authenticated users only)
 @router.get("/pvgis-tmy/", response_model=PvgisTmyResponse)
-async def generate_pvgis_tmy(latitude: float, longitude: float, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def generate_pvgis_tmy(latitude: float, longitude: float, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     """Generate TMY (Typical Meteorological Year) dataset from PVGIS using latitude and longitude.
     First checks if data exists in database, otherwise downloads from PVGIS and stores it.
     The coerce_year is configured via config files (pvgis_coerce_year setting)."""
-    import datetime
     import pvlib
     import pandas as pd
     from sqlalchemy import func, and_
-    from decimal import Decimal
     from app.core.config import get_cached_settings
 
     try:
@@ -150,8 +196,8 @@ async def generate_pvgis_tmy(latitude: float, longitude: float, db: AsyncSession
             select(func.count(WeatherMeasurements.id))
             .filter(
                 and_(
-                    WeatherMeasurements.latitude == Decimal(str(lat_rounded)),
-                    WeatherMeasurements.longitude == Decimal(str(lon_rounded))
+                    WeatherMeasurements.latitude == lat_rounded,
+                    WeatherMeasurements.longitude == lon_rounded
                 )
             )
         )
@@ -159,32 +205,8 @@ async def generate_pvgis_tmy(latitude: float, longitude: float, db: AsyncSession
 
         if existing_count >= 8760:
             # We have a complete dataset, retrieve it from database
-            result = await db.execute(
-                select(WeatherMeasurements)
-                .filter(
-                    and_(
-                        WeatherMeasurements.latitude == Decimal(str(lat_rounded)),
-                        WeatherMeasurements.longitude == Decimal(str(lon_rounded))
-                    )
-                )
-                .order_by(WeatherMeasurements.time_utc)
-            )
-            weather_records = result.scalars().all()
-
-            # Convert database records to pandas DataFrame format similar to PVGIS
-            data_records = []
-            for record in weather_records:
-                data_records.append({
-                    'temp_air': float(record.temp_air) if record.temp_air is not None else None,
-                    'relative_humidity': float(record.relative_humidity) if record.relative_humidity is not None else None,
-                    'ghi': float(record.ghi) if record.ghi is not None else None,
-                    'dni': float(record.dni) if record.dni is not None else None,
-                    'dhi': float(record.dhi) if record.dhi is not None else None,
-                    'IR(h)': float(record.ir_h) if record.ir_h is not None else None,
-                    'wind_speed': float(record.wind_speed) if record.wind_speed is not None else None,
-                    'wind_direction': float(record.wind_direction) if record.wind_direction is not None else None,
-                    'pressure': int(record.pressure) if record.pressure is not None else None
-                })
+            result = await db.execute(_TMY_RECORDS, {"latitude": lat_rounded, "longitude": lon_rounded})
+            data_records = [dict(row) for row in result.mappings()]
 
             # Create basic metadata similar to PVGIS format
             metadata_dict = {
@@ -222,45 +244,18 @@ async def generate_pvgis_tmy(latitude: float, longitude: float, db: AsyncSession
                 coerce_year=coerce_year
             )
 
-            # Store the downloaded data in the database
-            weather_measurements = []
-
-            # Create base datetime for the year - TMY data represents a typical year
-            base_year = coerce_year
-
-            for i, (timestamp, row) in enumerate(data.iterrows()):
-                # Create a datetime for each hour of the year
-                hour_of_year = i  # 0-8759
-                day_of_year = (hour_of_year // 24) + 1
-                hour_of_day = hour_of_year % 24
-
-                # Create datetime using the specified year
-                dt = datetime.datetime(base_year, 1, 1) + datetime.timedelta(days=day_of_year-1, hours=hour_of_day)
-                dt_utc = dt.replace(tzinfo=datetime.timezone.utc)
-
-                weather_measurement = WeatherMeasurements(
-                    time_utc=dt_utc,
-                    latitude=Decimal(str(lat_rounded)),
-                    longitude=Decimal(str(lon_rounded)),
-                    temp_air=float(row['temp_air']) if pd.notna(row['temp_air']) else None,
-                    relative_humidity=float(row['relative_humidity']) if pd.notna(row['relative_humidity']) else None,
-                    ghi=float(row['ghi']) if pd.notna(row['ghi']) else None,
-                    dni=float(row['dni']) if pd.notna(row['dni']) else None,
-                    dhi=float(row['dhi']) if pd.notna(row['dhi']) else None,
-                    ir_h=float(row['IR(h)']) if pd.notna(row['IR(h)']) else None,
-                    wind_speed=float(row['wind_speed']) if pd.notna(row['wind_speed']) else None,
-                    wind_direction=float(row['wind_direction']) % 360.0 if pd.notna(row['wind_direction']) else None,  # Normalize 360 to 0
-                    pressure=int(row['pressure']) if pd.notna(row['pressure']) else None
-                )
-                weather_measurements.append(weather_measurement)
-
-            # Bulk insert the weather measurements
-            db.add_all(weather_measurements)
-            await db.commit()
-
             # Convert pandas DataFrame to dict for JSON serialization
             data_records = data.to_dict(orient='records')
 
+            # COPY the weather measurements; rows already stored from a
+            # previous partial download are skipped by the unique constraint
+            await copy_rows(
+                db, WeatherMeasurements,
+                _tmy_weather_rows(data_records, lat_rounded, lon_rounded, coerce_year),
+                ignore_conflicts=True,
+            )
+            await db.commit()
+
             # Convert metadata to dict if it's not already
             metadata_dict = dict(metadata) if metadata else {}
 
@@ -280,11 +275,33 @@ async def generate_pvgis_tmy(latitude: float, longitude: float, db: AsyncSession
         raise HTTPException(status_code=500, detail=f"Error generating PVGIS TMY data: {str(e)}")
 
 
+_TRIP_SCHEDULE = (
+    select(
+        GtfsStops,
+        GtfsStopsTimes.arrival_time,
+        GtfsStopsTimes.departure_time,
+        GtfsStopsTimes.stop_sequence
+    )
+    .join(GtfsStopsTimes, GtfsStops.id == GtfsStopsTimes.stop_id)
+    .where(GtfsStopsTimes.trip_id == bindparam("trip_id"))
+    .order_by(GtfsStopsTimes.stop_sequence)
+)
+_TRIP_SHAPE_ID = select(GtfsTrips.shape_id).where(GtfsTrips.id == bindparam("trip_id"))
+
+
+async def _load_trip_schedule(db: AsyncSession, trip_id: UUID):
+    """A trip's (stop, arrival_time, departure_time, stop_sequence) rows and its shape_id"""
+    params = {"trip_id": trip_id}
+    result = await db.execute(_TRIP_SCHEDULE, params)
+    shape_id = await db.scalar(_TRIP_SHAPE_ID, params)
+    return result.all(), shape_id
+
+
 @router.post("/trip-statistics/", response_model=CombinedTripStatisticsResponse)
 async def compute_trip_statistics(
     request: TripStatisticsRequest,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Users = Depends(get_current_user)
+    current_user: Users = Depends(verify_jwt_token)
 ):
     """
     Compute combined trip statistics for one or multiple trips as a single sequence.
@@ -302,20 +319,16 @@ async def compute_trip_statistics(
     schedules: list[pd.DataFrame] = []
     elevation_dfs: list[pd.DataFrame] = []
 
-    for idx, trip_id in enumerate(request.trip_ids):
+    # The trips are independent, so their schedules are loaded concurrently. The
+    # request's own session is done (it only served the token check), so its
+    # connection goes back to the pool before the fan-out takes more.
+    await db.close()
+    trip_data = await gather_with_sessions(
+        db, *(partial(_load_trip_schedule, trip_id=trip_id) for trip_id in request.trip_ids)
+    )
+
+    for idx, (rows, shape_id) in enumerate(trip_data):
         # 1) Schedule
-        result = await db.execute(
-            select(
-                GtfsStops,
-                GtfsStopsTimes.arrival_time,
-                GtfsStopsTimes.departure_time,
-                GtfsStopsTimes.stop_sequence
-            )
-            .join(GtfsStopsTimes, GtfsStops.id == GtfsStopsTimes.stop_id)
-            .filter(GtfsStopsTimes.trip_id == trip_id)
-            .order_by(GtfsStopsTimes.stop_sequence)
-        )
-        rows = result.all()
         if rows:
             trip_schedule_data = [{
                 'stop_id': stop.stop_id,
@@ -331,15 +344,14 @@ async def compute_trip_statistics(
 
         # 2) Elevation (MinIO)
         try:
-            trip = await db.get(GtfsTrips, trip_id)
-            if trip and trip.shape_id:
+            if shape_id:
                 endpoint = os.getenv("MINIO_ENDPOINT", "minio:9000")
                 access_key = os.getenv("AWS_ACCESS_KEY_ID", "minio_user")
                 secret_key = os.getenv("AWS_SECRET_ACCESS_KEY", "minio_password")
                 secure = os.getenv("MINIO_SECURE", "false").lower() in ("1", "true", "yes", "on")
                 client = Minio(endpoint, access_key=access_key, secret_key=secret_key, secure=secure)
                 bucket_name = "elevation-profiles"
-                object_name = f"{trip.shape_id}.parquet"
+                object_name = f"{shape_id}.parquet"
                 response = client.get_object(bucket_name, object_name)
                 try:
                     data = response.read()
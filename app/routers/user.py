@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import bindparam, select, delete
+from sqlalchemy.orm import raiseload
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from app.database import get_async_session
+from app.database import columns_for, get_async_session
 from app.schemas.database import (
     BusesModelsCreate, BusesModelsRead, BusesModelsUpdate,
     BusesCreate, BusesRead, BusesUpdate,
@@ -18,20 +19,29 @@ from app.models import (
     Users, BusesModels, Buses, Depots, GtfsStops,
     Shifts, ShiftsStructures, GtfsTrips
 )
-from app.core.auth import get_current_user
+from app.core.auth import verify_jwt_token
 
 router = APIRouter()
 
+# Selects exactly the response columns as plain rows, no ORM instances; (name, user_id)
+# is unique, so pages come off user_buses_models_name_unique in a stable order
+_BUS_MODELS_LIST = select(*columns_for(BusesModels, BusesModelsRead)).order_by(BusesModels.name, BusesModels.user_id)
+
+_SHIFT_STRUCTURE = (
+    select(ShiftsStructures)
+    .where(ShiftsStructures.shift_id == bindparam("shift_id"))
+    .order_by(ShiftsStructures.sequence_number)
+)
+
 
 @router.get("/bus-models/", response_model=List[BusesModelsRead])
-async def read_bus_models(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
-    result = await db.execute(select(BusesModels).offset(skip).limit(limit))
-    bus_models = result.scalars().all()
-    return bus_models
+async def read_bus_models(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
+    result = await db.execute(_BUS_MODELS_LIST.offset(skip).limit(limit))
+    return result.mappings().all()
 
 
 @router.get("/bus-models/{model_id}", response_model=BusesModelsRead)
-async def read_bus_model(model_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_bus_model(model_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     bus_model = await db.get(BusesModels, model_id)
     if bus_model is None:
         raise HTTPException(status_code=404, detail="Bus model not found")
@@ -39,7 +49,7 @@ async def read_bus_model(model_id: UUID, db: AsyncSession = Depends(get_async_se
 
 
 @router.post("/bus-models/", response_model=BusesModelsRead)
-async def create_bus_model(bus_model: BusesModelsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_bus_model(bus_model: BusesModelsCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     # Validate user exists
     user = await db.get(Users, bus_model.user_id)
     if user is None:
@@ -47,11 +57,10 @@ async def create_bus_model(bus_model: BusesModelsCreate, db: AsyncSession = Depe
     db_bus_model = BusesModels(**bus_model.model_dump(exclude_unset=True))
     db.add(db_bus_model)
     await db.commit()
-    await db.refresh(db_bus_model)
     return db_bus_model
 
 @router.put("/bus-models/{model_id}", response_model=BusesModelsRead)
-async def update_bus_model(model_id: UUID, bus_model_update: BusesModelsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def update_bus_model(model_id: UUID, bus_model_update: BusesModelsUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_bus_model = await db.get(BusesModels, model_id)
     if db_bus_model is None:
         raise HTTPException(status_code=404, detail="Bus model not found")
@@ -66,12 +75,11 @@ async def update_bus_model(model_id: UUID, bus_model_update: BusesModelsUpdate,
         setattr(db_bus_model, field, value)
 
     await db.commit()
-    await db.refresh(db_bus_model)
     return db_bus_model
 
 
 @router.delete("/bus-models/{model_id}")
-async def delete_bus_model(model_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def delete_bus_model(model_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_bus_model = await db.get(BusesModels, model_id)
     if db_bus_model is None:
         raise HTTPException(status_code=404, detail="Bus model not found")
@@ -84,14 +92,14 @@ async def delete_bus_model(model_id: UUID, db: AsyncSession = Depends(get_async_
 
 
 @router.get("/buses/", response_model=List[BusesRead])
-async def read_buses(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
-    result = await db.execute(select(Buses).offset(skip).limit(limit))
+async def read_buses(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
+    result = await db.execute(select(Buses).options(raiseload("*")).offset(skip).limit(limit))
     buses = result.scalars().all()
     return buses
 
 
 @router.get("/buses/{bus_id}", response_model=BusesRead)
-async def read_bus(bus_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_bus(bus_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     bus = await db.get(Buses, bus_id)
     if bus is None:
         raise HTTPException(status_code=404, detail="Bus not found")
@@ -99,7 +107,7 @@ async def read_bus(bus_id: UUID, db: AsyncSession = Depends(get_async_session),
 
 
 @router.post("/buses/", response_model=BusesRead)
-async def create_bus(bus: BusesCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_bus(bus: BusesCreate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     # Validate user
     user = await db.get(Users, bus.user_id)
     if user is None:
@@ -112,11 +120,10 @@ async def create_bus(bus: BusesCreate, db: AsyncSession = Depends(get_async_sess
     db_bus = Buses(**bus.model_dump(exclude_unset=True))
     db.add(db_bus)
     await db.commit()
-    await db.refresh(db_bus)
     return db_bus
 
 @router.put("/buses/{bus_id}", response_model=BusesRead)
-async def update_bus(bus_id: UUID, bus_update: BusesUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def update_bus(bus_id: UUID, bus_update: BusesUpdate, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_bus = await db.get(Buses, bus_id)
     if db_bus is None:
         raise HTTPException(status_code=404, detail="Bus not found")
@@ -133,12 +140,11 @@ async def update_bus(bus_id: UUID, bus_update: BusesUpdate, db: AsyncSession = D
     for field, value in update_data.items():
         setattr(db_bus, field, value)
     await db.commit()
-    await db.refresh(db_bus)
     return db_bus
 
 
 @router.delete("/buses/{bus_id}")
-async def delete_bus(bus_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def delete_bus(bus_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_bus = await db.get(Buses, bus_id)
     if db_bus is None:
         raise HTTPException(status_code=404, detail="Bus not found")
@@ -156,7 +162,7 @@ def _validate_coords(lat: Optional[float], lon: Optional[float]):
 
 # Depot endpoints (authenticated users only)
 @router.post("/depots/", response_model=DepotReadWithLocation)
-async def create_depot(depot: DepotCreateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_depot(depot: DepotCreateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     # Validate coords and user
     _validate_coords(depot.latitude, depot.longitude)
     user = await db.get(Users, depot.user_id)
@@ -186,8 +192,6 @@ async def create_depot(depot: DepotCreateRequest, db: AsyncSession = Depends(get
     db.add(db_depot)
 
     await db.commit()
-    await db.refresh(db_depot)
-    await db.refresh(stop)
 
     return DepotReadWithLocation(
         id=db_depot.id,
@@ -202,7 +206,7 @@ async def create_depot(depot: DepotCreateRequest, db: AsyncSession = Depends(get
 
 
 @router.get("/depots/", response_model=List[DepotReadWithLocation])
-async def read_depots(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_depots(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     result = await db.execute(
         select(Depots, GtfsStops.stop_lat, GtfsStops.stop_lon)
         .join(GtfsStops, Depots.stop_id == GtfsStops.id, isouter=True)
@@ -225,7 +229,7 @@ async def read_depots(skip: int = 0, limit: int = 100, db: AsyncSession = Depend
 
 
 @router.get("/depots/{depot_id}", response_model=DepotReadWithLocation)
-async def read_depot(depot_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_depot(depot_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     result = await db.execute(
         select(Depots, GtfsStops.stop_lat, GtfsStops.stop_lon)
         .join(GtfsStops, Depots.stop_id == GtfsStops.id, isouter=True)
@@ -248,7 +252,7 @@ async def read_depot(depot_id: UUID, db: AsyncSession = Depends(get_async_sessio
 
 
 @router.put("/depots/{depot_id}", response_model=DepotReadWithLocation)
-async def update_depot(depot_id: UUID, depot_update: DepotUpdateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def update_depot(depot_id: UUID, depot_update: DepotUpdateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_depot = await db.get(Depots, depot_id)
     if db_depot is None:
         raise HTTPException(status_code=404, detail="Depot not found")
@@ -287,7 +291,6 @@ async def update_depot(depot_id: UUID, depot_update: DepotUpdateRequest, db: Asy
             stop.stop_lon = float(update_data["longitude"]) if update_data["longitude"] is not None else None
 
     await db.commit()
-    await db.refresh(db_depot)
 
     # Load stop coords for response
     lat = lon = None
@@ -310,7 +313,7 @@ async def update_depot(depot_id: UUID, depot_update: DepotUpdateRequest, db: Asy
 
 
 @router.delete("/depots/{depot_id}")
-async def delete_depot(depot_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def delete_depot(depot_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     db_depot = await db.get(Depots, depot_id)
     if db_depot is None:
         raise HTTPException(status_code=404, detail="Depot not found")
@@ -322,7 +325,7 @@ async def delete_depot(depot_id: UUID, db: AsyncSession = Depends(get_async_sess
 
 # Shifts endpoints (authenticated users only)
 @router.post("/shifts/", response_model=ShiftReadWithStructure)
-async def create_shift(payload: ShiftCreateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def create_shift(payload: ShiftCreateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     # Validate bus if provided
     bus_id = payload.bus_id
     if bus_id is not None:
@@ -347,16 +350,15 @@ async def create_shift(payload: ShiftCreateRequest, db: AsyncSession = Depends(g
         db.add(ss)
 
     await db.commit()
-    await db.refresh(db_shift)
 
-    rows = (await db.execute(select(ShiftsStructures).where(ShiftsStructures.shift_id == db_shift.id).order_by(ShiftsStructures.sequence_number))).scalars().all()
+    rows = (await db.execute(_SHIFT_STRUCTURE, {"shift_id": db_shift.id})).scalars().all()
     structure = [ShiftStructureItem(id=r.id, trip_id=r.trip_id, shift_id=r.shift_id, sequence_number=r.sequence_number) for r in rows]
     return ShiftReadWithStructure(id=db_shift.id, name=db_shift.name, bus_id=db_shift.bus_id, structure=structure)
 
 
 @router.get("/shifts/", response_model=List[ShiftReadWithStructure])
-async def list_shifts(skip: int = 0, limit: int = 100, bus_id: Optional[UUID] = None, user_id: Optional[UUID] = None, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
-    q = select(Shifts)
+async def list_shifts(skip: int = 0, limit: int = 100, bus_id: Optional[UUID] = None, user_id: Optional[UUID] = None, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
+    q = select(Shifts).options(raiseload("*"))
     if bus_id is not None:
         q = q.where(Shifts.bus_id == bus_id)
     if user_id is not None:
@@ -381,17 +383,17 @@ async def list_shifts(skip: int = 0, limit: int = 100, bus_id: Optional[UUID] =
 
 
 @router.get("/shifts/{shift_id}", response_model=ShiftReadWithStructure)
-async def read_shift(shift_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def read_shift(shift_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     shift = await db.get(Shifts, shift_id)
     if shift is None:
         raise HTTPException(status_code=404, detail="Shift not found")
-    rows = (await db.execute(select(ShiftsStructures).where(ShiftsStructures.shift_id == shift.id).order_by(ShiftsStructures.sequence_number))).scalars().all()
+    rows = (await db.execute(_SHIFT_STRUCTURE, {"shift_id": shift.id})).scalars().all()
     structure = [ShiftStructureItem(id=r.id, trip_id=r.trip_id, shift_id=r.shift_id, sequence_number=r.sequence_number) for r in rows]
     return ShiftReadWithStructure(id=shift.id, name=shift.name, bus_id=shift.bus_id, structure=structure)
 
 
 @router.put("/shifts/{shift_id}", response_model=ShiftReadWithStructure)
-async def update_shift(shift_id: UUID, payload: ShiftUpdateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def update_shift(shift_id: UUID, payload: ShiftUpdateRequest, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     shift = await db.get(Shifts, shift_id)
     if shift is None:
         raise HTTPException(status_code=404, detail="Shift not found")
@@ -422,15 +424,14 @@ async def update_shift(shift_id: UUID, payload: ShiftUpdateRequest, db: AsyncSes
             db.add(ss)
 
     await db.commit()
-    await db.refresh(shift)
 
-    rows = (await db.execute(select(ShiftsStructures).where(ShiftsStructures.shift_id == shift.id).order_by(ShiftsStructures.sequence_number))).scalars().all()
+    rows = (await db.execute(_SHIFT_STRUCTURE, {"shift_id": shift.id})).scalars().all()
     structure = [ShiftStructureItem(id=r.id, trip_id=r.trip_id, shift_id=r.shift_id, sequence_number=r.sequence_number) for r in rows]
     return ShiftReadWithStructure(id=shift.id, name=shift.name, bus_id=shift.bus_id, structure=structure)
 
 
 @router.delete("/shifts/{shift_id}")
-async def delete_shift(shift_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(get_current_user)):
+async def delete_shift(shift_id: UUID, db: AsyncSession = Depends(get_async_session), current_user: Users = Depends(verify_jwt_token)):
     shift = await db.get(Shifts, shift_id)
     if shift is None:
         raise HTTPException(status_code=404, detail="Shift not found")
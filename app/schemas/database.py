@@ -1,10 +1,14 @@
 # Auto-generated by generate_schemas.py
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Annotated, Optional, Any
 from datetime import date, datetime, time
 from decimal import Decimal
 from uuid import UUID
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, StringConstraints
+from app.enums import SimStatus, TripStatusValue, UserRole
+from app.types import GTFS_TIME_PATTERN
+
+GtfsTimeStr = Annotated[str, StringConstraints(pattern=GTFS_TIME_PATTERN)]
 
 class DepotsCreate(BaseModel):
     user_id: UUID
@@ -99,10 +103,10 @@ class ShiftsRead(BaseModel):
 class SimulationRunsCreate(BaseModel):
     user_id: UUID
     input_params: dict | list | None
-    status: str
+    status: SimStatus
     created_at: datetime
     variant_id: UUID
-    optimal_battery_kwh: Optional[Decimal] = None
+    optimal_battery_kwh: Optional[float] = None
     output_results: Optional[dict | list | None] = None
     completed_at: Optional[datetime] = None
 
@@ -110,10 +114,10 @@ class SimulationRunsUpdate(BaseModel):
     id: Optional[UUID] = None
     user_id: Optional[UUID] = None
     input_params: Optional[dict | list | None] = None
-    status: Optional[str] = None
+    status: Optional[SimStatus] = None
     created_at: Optional[datetime] = None
     variant_id: Optional[UUID] = None
-    optimal_battery_kwh: Optional[Decimal] = None
+    optimal_battery_kwh: Optional[float] = None
     output_results: Optional[dict | list | None] = None
     completed_at: Optional[datetime] = None
 
@@ -124,7 +128,7 @@ class SimulationRunsRead(BaseModel):
     status: str
     created_at: datetime
     variant_id: UUID
-    optimal_battery_kwh: Optional[Decimal]
+    optimal_battery_kwh: Optional[float]
     output_results: Optional[dict | list | None]
     completed_at: Optional[datetime]
     model_config = ConfigDict(from_attributes=True)
@@ -134,7 +138,7 @@ class GtfsTripsCreate(BaseModel):
     service_id: UUID
     gtfs_service_id: str
     trip_id: str
-    status: str
+    status: TripStatusValue
     trip_headsign: Optional[str] = None
     trip_short_name: Optional[str] = None
     direction_id: Optional[int] = None
@@ -144,8 +148,8 @@ class GtfsTripsCreate(BaseModel):
     bikes_allowed: Optional[int] = None
     start_stop_name: Optional[str] = None
     end_stop_name: Optional[str] = None
-    departure_time: Optional[str] = None
-    arrival_time: Optional[str] = None
+    departure_time: Optional[GtfsTimeStr] = None
+    arrival_time: Optional[GtfsTimeStr] = None
 
 class GtfsTripsUpdate(BaseModel):
     id: Optional[UUID] = None
@@ -153,7 +157,7 @@ class GtfsTripsUpdate(BaseModel):
     service_id: Optional[UUID] = None
     gtfs_service_id: Optional[str] = None
     trip_id: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[TripStatusValue] = None
     trip_headsign: Optional[str] = None
     trip_short_name: Optional[str] = None
     direction_id: Optional[int] = None
@@ -163,8 +167,8 @@ class GtfsTripsUpdate(BaseModel):
     bikes_allowed: Optional[int] = None
     start_stop_name: Optional[str] = None
     end_stop_name: Optional[str] = None
-    departure_time: Optional[str] = None
-    arrival_time: Optional[str] = None
+    departure_time: Optional[GtfsTimeStr] = None
+    arrival_time: Optional[GtfsTimeStr] = None
 
 class GtfsTripsRead(BaseModel):
     id: UUID
@@ -189,9 +193,9 @@ class GtfsTripsRead(BaseModel):
 class GtfsStopsTimesCreate(BaseModel):
     trip_id: UUID
     stop_id: UUID
-    arrival_time: Optional[str] = None
-    departure_time: Optional[str] = None
-    stop_sequence: Optional[int] = None
+    arrival_time: Optional[GtfsTimeStr] = None
+    departure_time: Optional[GtfsTimeStr] = None
+    stop_sequence: int
     stop_headsign: Optional[str] = None
     pickup_type: Optional[int] = None
     drop_off_type: Optional[int] = None
@@ -201,11 +205,10 @@ class GtfsStopsTimesCreate(BaseModel):
     continuous_drop_off: Optional[int] = None
 
 class GtfsStopsTimesUpdate(BaseModel):
-    id: Optional[UUID] = None
     trip_id: Optional[UUID] = None
     stop_id: Optional[UUID] = None
-    arrival_time: Optional[str] = None
-    departure_time: Optional[str] = None
+    arrival_time: Optional[GtfsTimeStr] = None
+    departure_time: Optional[GtfsTimeStr] = None
     stop_sequence: Optional[int] = None
     stop_headsign: Optional[str] = None
     pickup_type: Optional[int] = None
@@ -216,12 +219,11 @@ class GtfsStopsTimesUpdate(BaseModel):
     continuous_drop_off: Optional[int] = None
 
 class GtfsStopsTimesRead(BaseModel):
-    id: UUID
     trip_id: UUID
     stop_id: UUID
     arrival_time: Optional[str]
     departure_time: Optional[str]
-    stop_sequence: Optional[int]
+    stop_sequence: int
     stop_headsign: Optional[str]
     pickup_type: Optional[int]
     drop_off_type: Optional[int]
@@ -233,8 +235,8 @@ class GtfsStopsTimesRead(BaseModel):
 
 class WeatherMeasurementsCreate(BaseModel):
     time_utc: datetime
-    latitude: Decimal
-    longitude: Decimal
+    latitude: float
+    longitude: float
     temp_air: Optional[float] = None
     relative_humidity: Optional[float] = None
     ghi: Optional[float] = None
@@ -246,10 +248,10 @@ class WeatherMeasurementsCreate(BaseModel):
     pressure: Optional[int] = None
 
 class WeatherMeasurementsUpdate(BaseModel):
-    id: Optional[UUID] = None
+    id: Optional[int] = None
     time_utc: Optional[datetime] = None
-    latitude: Optional[Decimal] = None
-    longitude: Optional[Decimal] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     temp_air: Optional[float] = None
     relative_humidity: Optional[float] = None
     ghi: Optional[float] = None
@@ -261,10 +263,10 @@ class WeatherMeasurementsUpdate(BaseModel):
     pressure: Optional[int] = None
 
 class WeatherMeasurementsRead(BaseModel):
-    id: UUID
+    id: int
     time_utc: datetime
-    latitude: Decimal
-    longitude: Decimal
+    latitude: float
+    longitude: float
     temp_air: Optional[float]
     relative_humidity: Optional[float]
     ghi: Optional[float]
@@ -281,7 +283,7 @@ class UsersCreate(BaseModel):
     email: str
     full_name: str
     password_hash: str
-    role: str
+    role: UserRole
     created_at: datetime
 
 class UsersUpdate(BaseModel):
@@ -290,7 +292,7 @@ class UsersUpdate(BaseModel):
     email: Optional[str] = None
     full_name: Optional[str] = None
     password_hash: Optional[str] = None
-    role: Optional[str] = None
+    role: Optional[UserRole] = None
     created_at: Optional[datetime] = None
 
 class UsersRead(BaseModel):
@@ -0,0 +1,53 @@
+"""
+Custom column types shared by the model modules
+"""
+
+import re
+from typing import Optional, Union
+
+from sqlalchemy import Integer
+from sqlalchemy.types import TypeDecorator
+
+# H:MM:SS with hours past 23 allowed; shared with the API schemas
+GTFS_TIME_PATTERN = r"^\d{1,3}:[0-5]\d:[0-5]\d$"
+_GTFS_TIME = re.compile(GTFS_TIME_PATTERN)
+
+
+def gtfs_time_to_seconds(value: Union[str, int, None]) -> Optional[int]:
+    """Parse a GTFS HH:MM:SS time (hours may exceed 23) to seconds since midnight"""
+    if value is None or isinstance(value, int):
+        return value
+    value = value.strip()
+    if not value:
+        return None
+    if not _GTFS_TIME.match(value):
+        raise ValueError(f"Invalid GTFS time {value!r}, expected HH:MM:SS")
+    h, m, s = value.split(":")
+    return int(h) * 3600 + int(m) * 60 + int(s)
+
+
+def seconds_to_gtfs_time(value: Optional[int]) -> Optional[str]:
+    """Format seconds since midnight as a GTFS HH:MM:SS time"""
+    if value is None:
+        return None
+    m, s = divmod(value, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+
+class GtfsTime(TypeDecorator):
+    """GTFS time of day stored as integer seconds since midnight.
+
+    GTFS times run past 24:00:00 for trips after midnight, so Postgres TIME does not
+    fit. The column is a 4-byte integer that sorts and subtracts in SQL, while Python
+    code and the API keep exchanging HH:MM:SS strings.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return gtfs_time_to_seconds(value)
+
+    def process_result_value(self, value, dialect):
+        return seconds_to_gtfs_time(value)
@@ -76,6 +76,19 @@ CREATE TYPE public.trip_status AS ENUM (
 
 ALTER TYPE public.trip_status OWNER TO admin;
 
+--
+-- Name: user_role; Type: TYPE; Schema: public; Owner: admin
+--
+
+CREATE TYPE public.user_role AS ENUM (
+    'admin',
+    'analyst',
+    'viewer'
+);
+
+
+ALTER TYPE public.user_role OWNER TO admin;
+
 SET default_tablespace = '';
 
 SET default_table_access_method = heap;
@@ -183,8 +196,8 @@ CREATE TABLE public.gtfs_routes (
     route_color text,
     route_text_color text,
     route_sort_order integer,
-    continuous_pickup integer,
-    continuous_drop_off integer,
+    continuous_pickup smallint,
+    continuous_drop_off smallint,
     gtfs_file_date date DEFAULT '2025-04-14'::date NOT NULL,
     gtfs_year integer DEFAULT 2025 NOT NULL
 );
@@ -206,10 +219,10 @@ CREATE TABLE public.gtfs_stops (
     stop_lon double precision,
     zone_id text,
     stop_url text,
-    location_type integer,
+    location_type smallint,
     parent_station text,
     stop_timezone text,
-    wheelchair_boarding integer,
+    wheelchair_boarding smallint,
     platform_code text,
     level_id text,
     CONSTRAINT stop_lat_check CHECK (((stop_lat IS NULL) OR ((stop_lat >= ('-90'::integer)::double precision) AND (stop_lat <= (90)::double precision)))),
@@ -224,19 +237,18 @@ ALTER TABLE public.gtfs_stops OWNER TO admin;
 --
 
 CREATE TABLE public.gtfs_stops_times (
-    id uuid DEFAULT gen_random_uuid() NOT NULL,
     trip_id uuid NOT NULL,
-    arrival_time text,
-    departure_time text,
+    arrival_time integer,
+    departure_time integer,
     stop_id uuid NOT NULL,
-    stop_sequence integer,
+    stop_sequence integer NOT NULL,
     stop_headsign text,
-    pickup_type integer,
-    drop_off_type integer,
+    pickup_type smallint,
+    drop_off_type smallint,
     shape_dist_traveled double precision,
-    timepoint integer,
-    continuous_pickup integer,
-    continuous_drop_off integer
+    timepoint smallint,
+    continuous_pickup smallint,
+    continuous_drop_off smallint
 );
 
 
@@ -254,15 +266,15 @@ CREATE TABLE public.gtfs_trips (
     trip_id text NOT NULL,
     trip_headsign text,
     trip_short_name text,
-    direction_id integer,
+    direction_id smallint,
     block_id text,
     shape_id text,
-    wheelchair_accessible integer,
-    bikes_allowed integer,
+    wheelchair_accessible smallint,
+    bikes_allowed smallint,
     start_stop_name character varying,
     end_stop_name character varying,
-    departure_time character varying,
-    arrival_time character varying,
+    departure_time integer,
+    arrival_time integer,
     status public.trip_status DEFAULT 'gtfs'::public.trip_status NOT NULL
 );
 
@@ -304,7 +316,7 @@ CREATE TABLE public.simulation_runs (
     id uuid DEFAULT gen_random_uuid() NOT NULL,
     user_id uuid NOT NULL,
     input_params jsonb NOT NULL,
-    optimal_battery_kwh numeric,
+    optimal_battery_kwh double precision,
     output_results jsonb,
     status public.sim_status DEFAULT 'pending'::public.sim_status NOT NULL,
     created_at timestamp with time zone DEFAULT now() NOT NULL,
@@ -325,9 +337,8 @@ CREATE TABLE public.users (
     email text NOT NULL,
     full_name text NOT NULL,
     password_hash text NOT NULL,
-    role text NOT NULL,
-    created_at timestamp with time zone DEFAULT now() NOT NULL,
-    CONSTRAINT users_role_check CHECK ((role = ANY (ARRAY['admin'::text, 'analyst'::text, 'viewer'::text])))
+    role public.user_role NOT NULL,
+    created_at timestamp with time zone DEFAULT now() NOT NULL
 );
 
 
@@ -354,10 +365,10 @@ ALTER TABLE public.variants OWNER TO admin;
 --
 
 CREATE TABLE public.weather_measurements (
-    id uuid DEFAULT gen_random_uuid() NOT NULL,
+    id bigint NOT NULL,
     time_utc timestamp with time zone NOT NULL,
-    latitude numeric(8,5) NOT NULL,
-    longitude numeric(9,5) NOT NULL,
+    latitude double precision NOT NULL,
+    longitude double precision NOT NULL,
     temp_air real,
     relative_humidity real,
     ghi real,
@@ -367,8 +378,8 @@ CREATE TABLE public.weather_measurements (
     wind_speed real,
     wind_direction real,
     pressure integer,
-    CONSTRAINT ck_lat_range CHECK (((latitude >= ('-90'::integer)::numeric) AND (latitude <= (90)::numeric))),
-    CONSTRAINT ck_lon_range CHECK (((longitude >= ('-180'::integer)::numeric) AND (longitude <= (180)::numeric))),
+    CONSTRAINT ck_lat_range CHECK (((latitude >= ('-90'::integer)::double precision) AND (latitude <= (90)::double precision))),
+    CONSTRAINT ck_lon_range CHECK (((longitude >= ('-180'::integer)::double precision) AND (longitude <= (180)::double precision))),
     CONSTRAINT weather_measurements_pressure_check CHECK ((pressure > 0)),
     CONSTRAINT weather_measurements_relative_humidity_check CHECK (((relative_humidity >= (0)::double precision) AND (relative_humidity <= (100)::double precision))),
     CONSTRAINT weather_measurements_wind_direction_check CHECK (((wind_direction >= (0)::double precision) AND (wind_direction < (360)::double precision))),
@@ -378,6 +389,19 @@ CREATE TABLE public.weather_measurements (
 
 ALTER TABLE public.weather_measurements OWNER TO admin;
 
+--
+-- Name: weather_measurements_id_seq; Type: SEQUENCE; Schema: public; Owner: admin
+--
+
+ALTER TABLE public.weather_measurements ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
+    SEQUENCE NAME public.weather_measurements_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
 --
 -- Name: buses bus_name_user_id_unique; Type: CONSTRAINT; Schema: public; Owner: admin
 --
@@ -455,7 +479,7 @@ ALTER TABLE ONLY public.gtfs_stops
 --
 
 ALTER TABLE ONLY public.gtfs_stops_times
-    ADD CONSTRAINT gtfs_stops_times_pkey PRIMARY KEY (id);
+    ADD CONSTRAINT gtfs_stops_times_pkey PRIMARY KEY (trip_id, stop_sequence) INCLUDE (stop_id, arrival_time, departure_time);
 
 
 --
@@ -562,10 +586,38 @@ CREATE INDEX depots_agency_id_idx ON public.depots USING btree (user_id);
 
 
 --
--- Name: gtfs_stops_times_trip_seq_udx; Type: INDEX; Schema: public; Owner: admin
+-- Name: gtfs_agency_agency_name_idx; Type: INDEX; Schema: public; Owner: admin
 --
 
-CREATE UNIQUE INDEX gtfs_stops_times_trip_seq_udx ON public.gtfs_stops_times USING btree (trip_id, stop_sequence);
+CREATE INDEX gtfs_agency_agency_name_idx ON public.gtfs_agencies USING btree (agency_name, id);
+
+
+--
+-- Name: gtfs_calendar_service_id_idx; Type: INDEX; Schema: public; Owner: admin
+--
+
+CREATE INDEX gtfs_calendar_service_id_idx ON public.gtfs_calendar USING btree (service_id);
+
+
+--
+-- Name: gtfs_routes_agency_feed_idx; Type: INDEX; Schema: public; Owner: admin
+--
+
+CREATE INDEX gtfs_routes_agency_feed_idx ON public.gtfs_routes USING btree (agency_id, gtfs_year, gtfs_file_date);
+
+
+--
+-- Name: gtfs_stops_times_stop_id_idx; Type: INDEX; Schema: public; Owner: admin
+--
+
+CREATE INDEX gtfs_stops_times_stop_id_idx ON public.gtfs_stops_times USING btree (stop_id);
+
+
+--
+-- Name: gtfs_trips_route_service_idx; Type: INDEX; Schema: public; Owner: admin
+--
+
+CREATE INDEX gtfs_trips_route_service_idx ON public.gtfs_trips USING btree (route_id, service_id);
 
 
 --
@@ -631,6 +683,13 @@ CREATE INDEX shifts_structures_shift_idx ON public.shifts_structures USING btree
 CREATE INDEX shifts_structures_trip_idx ON public.shifts_structures USING btree (trip_id);
 
 
+--
+-- Name: simulation_runs_active_idx; Type: INDEX; Schema: public; Owner: admin
+--
+
+CREATE INDEX simulation_runs_active_idx ON public.simulation_runs USING btree (created_at) WHERE (status = ANY (ARRAY['pending'::public.sim_status, 'running'::public.sim_status]));
+
+
 --
 -- Name: simulation_runs_variant_id_idx; Type: INDEX; Schema: public; Owner: admin
 --
@@ -638,6 +697,13 @@ CREATE INDEX shifts_structures_trip_idx ON public.shifts_structures USING btree
 CREATE INDEX simulation_runs_variant_id_idx ON public.simulation_runs USING btree (variant_id);
 
 
+--
+-- Name: users_created_at_idx; Type: INDEX; Schema: public; Owner: admin
+--
+
+CREATE INDEX users_created_at_idx ON public.users USING btree (created_at, id);
+
+
 --
 -- Name: variants_route_id_idx; Type: INDEX; Schema: public; Owner: admin
 --
@@ -706,7 +772,7 @@ ALTER TABLE ONLY public.gtfs_stops_times
 --
 
 ALTER TABLE ONLY public.gtfs_stops_times
-    ADD CONSTRAINT gtfs_stops_times_trip_id_fkey FOREIGN KEY (trip_id) REFERENCES public.gtfs_trips(id);
+    ADD CONSTRAINT gtfs_stops_times_trip_id_fkey FOREIGN KEY (trip_id) REFERENCES public.gtfs_trips(id) ON DELETE CASCADE;
 
 
 --
@@ -0,0 +1,11 @@
+-- Store simulation_runs.optimal_battery_kwh as double precision instead of numeric.
+-- The value is a physical quantity: no exact decimal semantics are needed and a
+-- fixed 8-byte float avoids numeric arithmetic and Decimal decoding on every read.
+
+BEGIN;
+
+ALTER TABLE public.simulation_runs
+    ALTER COLUMN optimal_battery_kwh TYPE double precision
+    USING optimal_battery_kwh::double precision;
+
+COMMIT;
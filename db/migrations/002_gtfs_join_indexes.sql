@@ -0,0 +1,9 @@
+-- Indexes for the GTFS join paths that had none: stop -> stop times
+-- (routes/trips serving a stop) and route -> trips filtered by service calendar.
+-- (trip_id, stop_sequence) is already covered by gtfs_stops_times_trip_seq_udx.
+
+CREATE INDEX IF NOT EXISTS gtfs_stops_times_stop_id_idx
+    ON public.gtfs_stops_times USING btree (stop_id);
+
+CREATE INDEX IF NOT EXISTS gtfs_trips_route_service_idx
+    ON public.gtfs_trips USING btree (route_id, service_id);
@@ -0,0 +1,21 @@
+-- Store users.role as a 4-byte enum instead of free text guarded by a CHECK.
+-- The enum enforces the same three values, so users_role_check is dropped.
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'user_role') THEN
+        CREATE TYPE public.user_role AS ENUM ('admin', 'analyst', 'viewer');
+        ALTER TYPE public.user_role OWNER TO admin;
+    END IF;
+END
+$$;
+
+ALTER TABLE public.users DROP CONSTRAINT IF EXISTS users_role_check;
+
+ALTER TABLE public.users
+    ALTER COLUMN role TYPE public.user_role
+    USING role::public.user_role;
+
+COMMIT;
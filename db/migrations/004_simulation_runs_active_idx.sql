@@ -0,0 +1,7 @@
+-- Partial index over the runs that are still pending or running, ordered by
+-- creation time. Queue polling (oldest pending run first) then scans only the
+-- active runs, however many completed runs accumulate in the table.
+
+CREATE INDEX IF NOT EXISTS simulation_runs_active_idx
+    ON public.simulation_runs USING btree (created_at)
+    WHERE (status = ANY (ARRAY['pending'::public.sim_status, 'running'::public.sim_status]));
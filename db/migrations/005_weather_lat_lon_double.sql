@@ -0,0 +1,20 @@
+-- Store weather_measurements.latitude/longitude as double precision instead of
+-- numeric(8,5)/numeric(9,5). Coordinates need no exact decimal arithmetic, and
+-- every row read or COPYed no longer goes through numeric <-> Decimal conversion.
+-- The range checks are recreated against double precision.
+
+BEGIN;
+
+ALTER TABLE public.weather_measurements
+    DROP CONSTRAINT IF EXISTS ck_lat_range,
+    DROP CONSTRAINT IF EXISTS ck_lon_range;
+
+ALTER TABLE public.weather_measurements
+    ALTER COLUMN latitude TYPE double precision USING latitude::double precision,
+    ALTER COLUMN longitude TYPE double precision USING longitude::double precision;
+
+ALTER TABLE public.weather_measurements
+    ADD CONSTRAINT ck_lat_range CHECK (((latitude >= ('-90'::integer)::double precision) AND (latitude <= (90)::double precision))),
+    ADD CONSTRAINT ck_lon_range CHECK (((longitude >= ('-180'::integer)::double precision) AND (longitude <= (180)::double precision)));
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- Rebuild gtfs_stops_times_trip_seq_udx as a covering index. "Stop times of a
+-- trip in stop_sequence order" then reads stop_id and the arrival/departure times
+-- straight from the index (index-only scan) instead of visiting the heap per row.
+-- Run outside a transaction: the index is built and swapped concurrently.
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS gtfs_stops_times_trip_seq_cover_udx
+    ON public.gtfs_stops_times USING btree (trip_id, stop_sequence)
+    INCLUDE (stop_id, arrival_time, departure_time);
+
+DROP INDEX CONCURRENTLY IF EXISTS public.gtfs_stops_times_trip_seq_udx;
+
+ALTER INDEX IF EXISTS public.gtfs_stops_times_trip_seq_cover_udx
+    RENAME TO gtfs_stops_times_trip_seq_udx;
@@ -0,0 +1,31 @@
+-- Store gtfs_stops_times.arrival_time/departure_time as integer seconds since
+-- midnight instead of HH:MM:SS text (GTFS hours may exceed 23, so TIME does not
+-- fit). 4 bytes per value instead of a varlena string; the application converts
+-- to and from HH:MM:SS (app.types.GtfsTime). Blank values become NULL.
+-- The covering index on (trip_id, stop_sequence) is rebuilt by the type change.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'gtfs_stops_times'
+          AND column_name = 'arrival_time' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE public.gtfs_stops_times
+            ALTER COLUMN arrival_time TYPE integer USING (
+                CASE WHEN btrim(arrival_time) ~ '^\d+:\d{1,2}:\d{1,2}$' THEN
+                    split_part(btrim(arrival_time), ':', 1)::integer * 3600
+                    + split_part(btrim(arrival_time), ':', 2)::integer * 60
+                    + split_part(btrim(arrival_time), ':', 3)::integer
+                END
+            ),
+            ALTER COLUMN departure_time TYPE integer USING (
+                CASE WHEN btrim(departure_time) ~ '^\d+:\d{1,2}:\d{1,2}$' THEN
+                    split_part(btrim(departure_time), ':', 1)::integer * 3600
+                    + split_part(btrim(departure_time), ':', 2)::integer * 60
+                    + split_part(btrim(departure_time), ':', 3)::integer
+                END
+            );
+    END IF;
+END
+$$;
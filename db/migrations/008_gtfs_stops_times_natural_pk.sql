@@ -0,0 +1,26 @@
+-- Make the GTFS natural key (trip_id, stop_sequence) the primary key of
+-- gtfs_stops_times and drop the synthetic uuid id, which nothing references.
+-- The new key carries the same INCLUDE columns as the unique covering index it
+-- replaces, so the per-trip schedule lookup stays index-only.
+--
+-- Optionally, in a maintenance window (takes an ACCESS EXCLUSIVE lock), lay the
+-- heap out by trip so a trip's stop times share a few pages:
+--   CLUSTER public.gtfs_stops_times USING gtfs_stops_times_pkey;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'gtfs_stops_times'
+          AND column_name = 'id'
+    ) THEN
+        ALTER TABLE public.gtfs_stops_times
+            DROP CONSTRAINT gtfs_stops_times_pkey,
+            DROP COLUMN id,
+            ALTER COLUMN stop_sequence SET NOT NULL,
+            ADD CONSTRAINT gtfs_stops_times_pkey PRIMARY KEY (trip_id, stop_sequence)
+                INCLUDE (stop_id, arrival_time, departure_time);
+        DROP INDEX IF EXISTS public.gtfs_stops_times_trip_seq_udx;
+    END IF;
+END
+$$;
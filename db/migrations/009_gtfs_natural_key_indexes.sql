@@ -0,0 +1,10 @@
+-- Indexes for the GTFS lookups by natural key that still scanned:
+-- calendar by service_id (auxiliary trip creation) and routes by agency and feed
+-- version (the max(gtfs_year)/max(gtfs_file_date) probes and the route listings
+-- filtered on them). gtfs_trips.trip_id is already covered by gtfs_trips_trip_id_udx.
+
+CREATE INDEX IF NOT EXISTS gtfs_calendar_service_id_idx
+    ON public.gtfs_calendar USING btree (service_id);
+
+CREATE INDEX IF NOT EXISTS gtfs_routes_agency_feed_idx
+    ON public.gtfs_routes USING btree (agency_id, gtfs_year, gtfs_file_date);
@@ -0,0 +1,22 @@
+-- Replace the random uuid primary key of weather_measurements with a bigint
+-- identity. The table is append-heavy (PVGIS imports) and the id is not
+-- referenced anywhere; a sequential 8-byte key keeps inserts on the rightmost
+-- btree page instead of splitting pages across the whole index.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'weather_measurements'
+          AND column_name = 'id' AND data_type = 'uuid'
+    ) THEN
+        ALTER TABLE public.weather_measurements
+            DROP CONSTRAINT weather_measurements_pkey,
+            DROP COLUMN id;
+        ALTER TABLE public.weather_measurements
+            ADD COLUMN id bigint GENERATED ALWAYS AS IDENTITY
+                (SEQUENCE NAME public.weather_measurements_id_seq),
+            ADD CONSTRAINT weather_measurements_pkey PRIMARY KEY (id);
+    END IF;
+END
+$$;
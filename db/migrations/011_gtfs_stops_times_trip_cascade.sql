@@ -0,0 +1,7 @@
+-- Let deleting a trip remove its stop times in the database, like its shift
+-- structures already are, instead of the API loading and deleting them row by row.
+
+ALTER TABLE public.gtfs_stops_times
+    DROP CONSTRAINT IF EXISTS gtfs_stops_times_trip_id_fkey,
+    ADD CONSTRAINT gtfs_stops_times_trip_id_fkey FOREIGN KEY (trip_id)
+        REFERENCES public.gtfs_trips(id) ON DELETE CASCADE;
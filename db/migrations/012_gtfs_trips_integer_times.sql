@@ -0,0 +1,29 @@
+-- Store gtfs_trips.departure_time/arrival_time as integer seconds since midnight,
+-- like gtfs_stops_times (007). The application converts to and from HH:MM:SS
+-- (app.types.GtfsTime). Blank or malformed values become NULL.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'gtfs_trips'
+          AND column_name = 'departure_time' AND data_type = 'character varying'
+    ) THEN
+        ALTER TABLE public.gtfs_trips
+            ALTER COLUMN departure_time TYPE integer USING (
+                CASE WHEN btrim(departure_time) ~ '^\d+:\d{1,2}:\d{1,2}$' THEN
+                    split_part(btrim(departure_time), ':', 1)::integer * 3600
+                    + split_part(btrim(departure_time), ':', 2)::integer * 60
+                    + split_part(btrim(departure_time), ':', 3)::integer
+                END
+            ),
+            ALTER COLUMN arrival_time TYPE integer USING (
+                CASE WHEN btrim(arrival_time) ~ '^\d+:\d{1,2}:\d{1,2}$' THEN
+                    split_part(btrim(arrival_time), ':', 1)::integer * 3600
+                    + split_part(btrim(arrival_time), ':', 2)::integer * 60
+                    + split_part(btrim(arrival_time), ':', 3)::integer
+                END
+            );
+    END IF;
+END
+$$;
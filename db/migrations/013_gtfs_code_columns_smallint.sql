@@ -0,0 +1,64 @@
+-- Store the GTFS enumerated code columns (pickup/drop-off types, direction,
+-- accessibility flags, location type; all single-digit domains) as smallint.
+-- On gtfs_stops_times, the largest table, the five code columns shrink from
+-- 20 to 10 bytes per row.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'gtfs_stops'
+          AND column_name = 'location_type' AND data_type = 'integer'
+    ) THEN
+        ALTER TABLE public.gtfs_stops
+            ALTER COLUMN location_type TYPE smallint,
+            ALTER COLUMN wheelchair_boarding TYPE smallint;
+    END IF;
+END
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'gtfs_routes'
+          AND column_name = 'continuous_pickup' AND data_type = 'integer'
+    ) THEN
+        ALTER TABLE public.gtfs_routes
+            ALTER COLUMN continuous_pickup TYPE smallint,
+            ALTER COLUMN continuous_drop_off TYPE smallint;
+    END IF;
+END
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'gtfs_trips'
+          AND column_name = 'direction_id' AND data_type = 'integer'
+    ) THEN
+        ALTER TABLE public.gtfs_trips
+            ALTER COLUMN direction_id TYPE smallint,
+            ALTER COLUMN wheelchair_accessible TYPE smallint,
+            ALTER COLUMN bikes_allowed TYPE smallint;
+    END IF;
+END
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'gtfs_stops_times'
+          AND column_name = 'pickup_type' AND data_type = 'integer'
+    ) THEN
+        ALTER TABLE public.gtfs_stops_times
+            ALTER COLUMN pickup_type TYPE smallint,
+            ALTER COLUMN drop_off_type TYPE smallint,
+            ALTER COLUMN timepoint TYPE smallint,
+            ALTER COLUMN continuous_pickup TYPE smallint,
+            ALTER COLUMN continuous_drop_off TYPE smallint;
+    END IF;
+END
+$$;
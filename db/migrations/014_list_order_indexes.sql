@@ -0,0 +1,10 @@
+-- Indexes matching the ORDER BY of the paginated user and agency listings, so
+-- OFFSET/LIMIT pages are read in index order instead of sorting the whole
+-- table. The bus-model listing orders by (name, user_id) and is already served
+-- by user_buses_models_name_unique.
+
+CREATE INDEX IF NOT EXISTS users_created_at_idx
+    ON public.users USING btree (created_at, id);
+
+CREATE INDEX IF NOT EXISTS gtfs_agency_agency_name_idx
+    ON public.gtfs_agencies USING btree (agency_name, id);
@@ -37,6 +37,16 @@ from sqlalchemy.sql.sqltypes import (
 
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, ARRAY
 
+from app.enums import SIM_STATUS, TRIP_STATUS, USER_ROLE
+from app.types import GtfsTime
+
+# Literal aliases in app.enums for the shared Postgres enum types
+ENUM_LITERALS = {
+    SIM_STATUS.name: "SimStatus",
+    TRIP_STATUS.name: "TripStatusValue",
+    USER_ROLE.name: "UserRole",
+}
+
 PY_TYPE_FALLBACKS = {
     Integer: int,
     SmallInteger: int,
@@ -126,6 +136,12 @@ def build_schema_text(mapper: Mapper, include_relationships: bool = False) -> st
 
         read_fields.append(f"    {c.name}: {opt_prefix}{pytype}{opt_suffix}")
 
+        # Client-supplied GTFS times and enum values are checked before they reach the column
+        if isinstance(c.type, GtfsTime):
+            pytype = "GtfsTimeStr"
+        elif getattr(c.type, "name", None) in ENUM_LITERALS:
+            pytype = ENUM_LITERALS[c.type.name]
+
         if not is_autoincrement_pk(c) and not c.primary_key:
             default = " = None" if c.nullable and c.default is None and c.server_default is None else ""
             create_fields.append(f"    {c.name}: {opt_prefix}{pytype}{opt_suffix}{default}")
@@ -209,11 +225,15 @@ def main():
     lines: List[str] = []
     header = """# Auto-generated by generate_schemas.py
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Annotated, Optional, Any
 from datetime import date, datetime, time
 from decimal import Decimal
 from uuid import UUID
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, StringConstraints
+from app.enums import SimStatus, TripStatusValue, UserRole
+from app.types import GTFS_TIME_PATTERN
+
+GtfsTimeStr = Annotated[str, StringConstraints(pattern=GTFS_TIME_PATTERN)]
 """
     lines.append(header)
 
@@ -8,7 +8,7 @@ import uuid
 import time
 import asyncio
 import pytest
-from jose import jwt
+import jwt
 from datetime import datetime, timedelta, UTC
 from fastapi.testclient import TestClient
 
@@ -159,6 +159,18 @@ def test_expired_token(client, record):
     r = client.get(f"{API_BASE}/user/buses/", headers={"Authorization": f"Bearer {token}"})
     record("expired_token", r.status_code == 401, f"status={r.status_code}")
 
+def test_repeated_requests_same_token(client, record):
+    """Repeated requests with one token resolve the same user (verification cache path)"""
+    token = get_auth_token(client)
+    if not token:
+        pytest.skip("TEST_API_TOKEN or TEST_LOGIN_EMAIL/TEST_LOGIN_PASSWORD are required")
+    ids = []
+    for _ in range(3):
+        r = client.get(f"{AUTH_BASE}/me", headers=auth_headers(token))
+        record("repeated_me_status", r.status_code == 200, f"status={r.status_code}")
+        ids.append(r.json().get("id"))
+    record("repeated_me_same_user", len(set(ids)) == 1, f"ids={ids}")
+
 def test_swagger_available(client, record):
     r = client.get("/docs")
     record("swagger_ui", r.status_code == 200 and b"swagger" in r.content.lower(), f"status={r.status_code}")
@@ -337,6 +349,26 @@ def test_update_profile(client, record):
         _delete_user(email)
 
 
+def test_profile_update_visible_with_same_token(client, record):
+    """A profile change must be visible immediately through the token used to make it."""
+    email, password = _register_temp_user(client, password=STRONG_PASSWORD)
+    try:
+        login = client.post(f"{AUTH_BASE}/login", json={"email": email, "password": password})
+        assert login.status_code == 200, f"temp login failed: {login.text}"
+        headers = auth_headers(login.json().get("access_token"))
+
+        before = client.get(f"{AUTH_BASE}/me", headers=headers)
+        assert before.status_code == 200
+        r = client.put(f"{AUTH_BASE}/me", json={"full_name": "Renamed User"}, headers=headers)
+        assert r.status_code == 200, f"update failed: {r.text}"
+
+        after = client.get(f"{AUTH_BASE}/me", headers=headers)
+        record("profile_update_visible", after.status_code == 200 and after.json().get("full_name") == "Renamed User",
+               f"status={after.status_code} body={after.text}")
+    finally:
+        _delete_user(email)
+
+
 def test_delete_me_ephemeral_user(client, record):
     """Create a temp user, delete via DELETE /auth/me, ensure it's gone."""
     # Register temp user
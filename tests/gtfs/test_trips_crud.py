@@ -139,3 +139,34 @@ def test_trip_delete_cleanup(client: TestClient, record):
         record("delete_trip2_404", r_del_again.status_code == 404, f"status={r_del_again.status_code}")
 
 
+@pytest.mark.skipif(
+    not (os.getenv("TEST_API_TOKEN") or (TEST_LOGIN_EMAIL and TEST_LOGIN_PASSWORD)),
+    reason="Requires auth env vars",
+)
+def test_trip_malformed_time_rejected(client: TestClient, record):
+    headers = _auth_headers(client)
+    if not headers:
+        record("auth_missing3", False, "No auth token available")
+        return
+
+    # Times are validated against HH:MM:SS before anything is written
+    trip = {
+        "route_id": str(uuid.uuid4()),
+        "service_id": str(uuid.uuid4()),
+        "gtfs_service_id": "svc-test",
+        "trip_id": f"test-trip-{uuid.uuid4()}",
+        "status": "other",
+        "departure_time": "8h",
+    }
+    r_create = client.post(f"{API_BASE}/gtfs-trips/", json=trip, headers=headers)
+    record("create_trip_bad_time_422", r_create.status_code == 422, f"status={r_create.status_code} body={r_create.text}")
+
+    aux = {
+        "departure_stop_id": str(uuid.uuid4()),
+        "arrival_stop_id": str(uuid.uuid4()),
+        "departure_time": "08:00",
+        "arrival_time": "08:15:00",
+        "route_id": str(uuid.uuid4()),
+    }
+    r_aux = client.post(f"{API_BASE}/aux-trip", json=aux, headers=headers)
+    record("create_aux_trip_bad_time_422", r_aux.status_code == 422, f"status={r_aux.status_code} body={r_aux.text}")
@@ -6,8 +6,11 @@ Generates a human-readable report in tests/reports/ via report_collector fixture
 import os
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 import uuid
 
+from app.database import engine
+
 __report_module__ = "bus_models_crud"
 
 API_BASE = "/api/v1/user"
@@ -138,3 +141,29 @@ def test_bus_model_invalid_agency_fk(client: TestClient, record):
     record("bm_create_invalid_fk", r.status_code == 400, f"status={r.status_code}")
 
 
+def test_bus_model_list_single_query(client: TestClient, record):
+    token = get_auth_token(client)
+    if not token:
+        record("bm_nq_auth_failed", False, "login failed")
+        return
+    hdrs = auth_headers(token)
+    created = [create_bus_model(client, token, name=f"Test Model NQ {i}") for i in range(3)]
+
+    statements: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if "buses_models" in statement:
+            statements.append(statement)
+
+    try:
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+        try:
+            r = client.get(f"{API_BASE}/bus-models/", headers=hdrs)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", count)
+        record("bm_list_status", r.status_code == 200, f"status={r.status_code}")
+        record("bm_list_single_query", len(statements) == 1, f"queries={len(statements)}")
+    finally:
+        for model_id in created:
+            if model_id:
+                client.delete(f"{API_BASE}/bus-models/{model_id}", headers=hdrs)
@@ -1,5 +1,6 @@
 import os
 import uuid
+import pytest
 from fastapi.testclient import TestClient
 
 API_BASE = "/api/v1/user"
@@ -71,3 +72,19 @@ def test_fk_violation_returns_409(client: TestClient):
     # might not trigger here. If validation changes, FK violation should map to 409.
     assert r.status_code in (400, 409), f"unexpected status {r.status_code}: {r.text}"
 
+
+def test_unknown_user_role_returns_422(client: TestClient):
+    token = _get_token(client)
+    payload = {
+        "company_id": str(uuid.uuid4()),
+        "email": f"tmp_{uuid.uuid4().hex[:8]}@example.com",
+        "full_name": "Role Test",
+        "password_hash": "x",
+        "role": "superuser",
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+    r = client.post("/api/v1/agency/users/", json=payload, headers=_hdrs(token))
+    if r.status_code == 403:
+        pytest.skip("TEST_LOGIN_EMAIL is not an admin")
+    # Rejected by the schema, before the user_role enum cast could fail in Postgres
+    assert r.status_code == 422, f"expected 422, got {r.status_code}: {r.text}"